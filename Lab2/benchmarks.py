@@ -0,0 +1,299 @@
+"""CSC148 Lab 2: Benchmarks
+
+=== CSC148 Winter 2025 ===
+Department of Computer Science,
+University of Toronto
+
+=== Module description ===
+This module contains benchmarks for the classes in tweet.py and the modules
+built on top of it. Run it directly to print the results of every benchmark.
+"""
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+# Contract checking would dominate every measurement below. Its own cost is
+# measured by bench_contracts.py at the top of the repository.
+os.environ['CHECK_CONTRACTS'] = '0'
+
+from leaderboard import Leaderboard
+from player import Player
+from registry import UserRegistry
+from social_graph import SocialGraph
+from text_index import TextIndex
+from tweet import Tweet, User, bulk_edit
+from tweet_io import dump_binary, dump_jsonl, iter_binary, iter_jsonl, load, records
+from tweet_store import TweetStore
+
+
+def _dates(n: int) -> list[date]:
+    """Return <n> consecutive dates, one per tweet, cycling through a year.
+    """
+    start = date(2024, 1, 1)
+    return [start + timedelta(days=i % 365) for i in range(n)]
+
+
+def bench_store_memory(n: int = 1_000_000) -> None:
+    """Print the memory used by <n> tweets stored as a list[Tweet] and as a
+    TweetStore.
+    """
+    dates = _dates(n)
+
+    tracemalloc.start()
+    tweets = []
+    for i in range(n):
+        tweets.append(Tweet(f'user{i % 1000}', dates[i], f'tweet number {i}'))
+    list_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del tweets
+
+    tracemalloc.start()
+    store = TweetStore()
+    for i in range(n):
+        store.add(f'user{i % 1000}', dates[i], f'tweet number {i}')
+    store_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del store
+
+    print(f'{n} tweets as list[Tweet]: {list_bytes / 2 ** 20:8.1f} MiB')
+    print(f'{n} tweets in TweetStore:  {store_bytes / 2 ** 20:8.1f} MiB')
+    print(f'ratio: {list_bytes / store_bytes:.1f}x')
+
+
+def bench_graph_bulk_load(n_users: int = 100_000, n_edges: int = 2_000_000) -> None:
+    """Print how long SocialGraph takes to bulk load <n_edges> random follows
+    between <n_users> users, compared with calling follow once per edge.
+    """
+    rng = random.Random(148)
+    pairs = [(rng.randrange(n_users), rng.randrange(n_users)) for _ in range(n_edges)]
+
+    graph = SocialGraph()
+    start = time.perf_counter()
+    added = graph.add_edges(iter(pairs))
+    bulk = time.perf_counter() - start
+
+    graph = SocialGraph()
+    start = time.perf_counter()
+    for follower, followee in pairs:
+        graph.follow(follower, followee)
+    one_by_one = time.perf_counter() - start
+
+    print(f'add_edges: {added} edges in {bulk:.2f}s '
+          f'({n_edges / bulk / 1e6:.2f}M pairs/s)')
+    print(f'follow:    {added} edges in {one_by_one:.2f}s '
+          f'({n_edges / one_by_one / 1e6:.2f}M pairs/s)')
+
+
+def _users_with_tweets(n_users: int, tweets_per_user: int,
+                       text_index: TextIndex | None = None) -> list[User]:
+    """Return <n_users> new users who have each made <tweets_per_user> tweets,
+    recorded in <text_index> if given.
+    """
+    users = [User(f'user{i}', '', text_index=text_index)
+             for i in range(n_users)]
+    for user in users:
+        for i in range(tweets_per_user):
+            user.tweet(f'tweet {i} from {user.userid}')
+    return users
+
+
+def bench_bulk_edit(n_users: int = 1_000, tweets_per_user: int = 1_000) -> None:
+    """Print the throughput of bulk_edit compared with calling Tweet.edit on
+    every matching tweet, when every other tweet matches, for users with no
+    text index and for users sharing one.
+    """
+    def predicate(tweet: Tweet) -> bool:
+        return tweet.content[6] in '02468'
+
+    for label, make_index in [('no index', lambda: None), ('text index', TextIndex)]:
+        users = _users_with_tweets(n_users, tweets_per_user, make_index())
+        start = time.perf_counter()
+        rewritten = 0
+        for user in users:
+            for tweet in user.tweets:
+                if predicate(tweet):
+                    tweet.edit('[redacted]')
+                    rewritten += 1
+        loop = time.perf_counter() - start
+
+        users = _users_with_tweets(n_users, tweets_per_user, make_index())
+        start = time.perf_counter()
+        rewritten = bulk_edit(users + users, predicate, '[redacted]')
+        bulk = time.perf_counter() - start
+
+        print(f'{label:>10}: Tweet.edit loop {rewritten / loop / 1e6:.2f}M tweets/s, '
+              f'bulk_edit {rewritten / bulk / 1e6:.2f}M tweets/s')
+
+
+def bench_io(n_users: int = 1_000, tweets_per_user: int = 1_000) -> None:
+    """Print the throughput of saving and loading <n_users> users with
+    <tweets_per_user> tweets each in both file formats of tweet_io.
+    """
+    users = _users_with_tweets(n_users, tweets_per_user)
+    n_tweets = n_users * tweets_per_user
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, mode, dump, iterate in [('jsonl', '', dump_jsonl, iter_jsonl),
+                                          ('binary', 'b', dump_binary, iter_binary)]:
+            path = os.path.join(tmp, f'tweets.{name}')
+            start = time.perf_counter()
+            with open(path, 'w' + mode) as fp:
+                dump(records(users), fp)
+            dumped = time.perf_counter() - start
+
+            start = time.perf_counter()
+            with open(path, 'r' + mode) as fp:
+                load(iterate(fp))
+            loaded = time.perf_counter() - start
+
+            print(f'{name:>6}: {os.path.getsize(path) / n_tweets:5.1f} bytes/tweet, '
+                  f'dump {n_tweets / dumped / 1e3:6.0f}k tweets/s, '
+                  f'load {n_tweets / loaded / 1e3:6.0f}k tweets/s')
+
+
+def bench_retweet_memory(n: int = 100_000) -> None:
+    """Print the memory used per retweet by User.retweet and by the original
+    retweet helper, Tweet(new_user, new_date, tweet.content), for a short and
+    a 280-character tweet.
+
+    Both share the original's content string, so neither grows with the
+    length of the content.
+    """
+    retweeted_on = date(2017, 8, 20)
+    for length in (10, 280):
+        original = Tweet('David', date(2017, 8, 19), 'x' * length)
+
+        user = User('Diane', '')
+        tracemalloc.start()
+        for _ in range(n):
+            user.retweet(original, retweeted_on)
+        method = tracemalloc.get_traced_memory()[0] / n
+        tracemalloc.stop()
+
+        retweets = []
+        tracemalloc.start()
+        for _ in range(n):
+            retweets.append(Tweet('Diane', retweeted_on, original.content))
+        helper = tracemalloc.get_traced_memory()[0] / n
+        tracemalloc.stop()
+
+        print(f'{length:3}-character tweet: User.retweet {method:4.0f} bytes/retweet, '
+              f'original helper {helper:4.0f} bytes/retweet')
+
+
+def bench_text_search(sizes: tuple[int, ...] = (10_000, 100_000, 1_000_000)) -> None:
+    """Print the latency of a two-word AND query and of a one-day query for a
+    word in every tweet on TextIndex, compared with scanning every tweet, for
+    corpora of each size in <sizes>.
+
+    Each tweet has the word 'the' and 5 words drawn from a 10,000-word
+    vocabulary, plus the word 'rare' in 1 tweet out of 10,000. The tweets are
+    spread evenly over a year.
+    """
+    rng = random.Random(148)
+    vocabulary = [f'w{i}' for i in range(10_000)]
+    day = date(2024, 7, 1)
+    for n in sizes:
+        index = TextIndex()
+        tweets = []
+        for i, when in enumerate(sorted(_dates(n))):
+            words = ['the'] + rng.sample(vocabulary, 5) + (['rare'] if i % 10_000 == 0 else [])
+            tweet = Tweet('user', when, ' '.join(words))
+            tweets.append(tweet)
+            index.add(tweet)
+
+        start = time.perf_counter()
+        for _ in range(100):
+            index.search(['rare', 'w1'])
+        indexed = (time.perf_counter() - start) / 100
+
+        start = time.perf_counter()
+        for _ in range(100):
+            index.search(['the'], since=day, until=day)
+        ranged = (time.perf_counter() - start) / 100
+
+        start = time.perf_counter()
+        [t for t in tweets if 'rare' in t.content.split() and 'w1' in t.content.split()]
+        scanned = time.perf_counter() - start
+
+        print(f'{n:>9} tweets: AND query {indexed * 1e6:8.1f} us, '
+              f'one-day query {ranged * 1e6:8.1f} us, scan {scanned * 1e6:10.1f} us')
+
+
+def bench_registry(workers: tuple[int, ...] = (1, 2, 4, 8), n_users: int = 1_000,
+                   ops_per_worker: int = 20_000) -> None:
+    """Print the throughput of UserRegistry when <workers> threads each like a
+    shared set of tweets and make new tweets, and check that no like or tweet
+    was lost.
+    """
+    for n_workers in workers:
+        registry = UserRegistry()
+        for i in range(n_users):
+            registry.add_user(User(f'user{i}', ''))
+        targets = [registry.tweet(f'user{i}', 'like me') for i in range(n_users)]
+
+        def work(seed: int) -> None:
+            rng = random.Random(seed)
+            for _ in range(ops_per_worker):
+                if rng.random() < 0.9:
+                    registry.like(targets[rng.randrange(n_users)], 1)
+                else:
+                    registry.tweet(f'user{rng.randrange(n_users)}', 'hello')
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(n_workers) as pool:
+            list(pool.map(work, range(n_workers)))
+        elapsed = time.perf_counter() - start
+
+        likes = sum(t.likes for t in targets)
+        tweets = sum(len(registry.get(f'user{i}').tweets) for i in range(n_users))
+        exact = likes + tweets - n_users == n_workers * ops_per_worker
+        print(f'{n_workers} workers: {n_workers * ops_per_worker / elapsed / 1e3:6.0f}k ops/s, '
+              f'counts {"exact" if exact else "WRONG"}')
+
+
+def bench_leaderboard(n_players: int = 100_000, n_scores: int = 100) -> None:
+    """Print how long it takes to compute every player's average of their
+    last 10 scores and their top score, with one Leaderboard compared with
+    calling get_average and get_top_score on each Player.
+    """
+    rng = random.Random(148)
+    players = []
+    for i in range(n_players):
+        player = Player(f'player{i}')
+        player.add_scores([rng.randrange(1000) for _ in range(n_scores)])
+        players.append(player)
+    board = Leaderboard.from_players(players)
+
+    start = time.perf_counter()
+    [player.get_average(10) for player in players]
+    [player.get_top_score() for player in players]
+    loop = time.perf_counter() - start
+
+    start = time.perf_counter()
+    board.averages(10)
+    board.top_scores()
+    vectorized = time.perf_counter() - start
+
+    start = time.perf_counter()
+    board.percentiles(90)
+    board.ranking(10)
+    extra = time.perf_counter() - start
+
+    print(f'{n_players} players: Player loop {loop * 1e3:7.1f} ms, '
+          f'Leaderboard {vectorized * 1e3:7.1f} ms '
+          f'(+ percentiles and ranking {extra * 1e3:.1f} ms)')
+
+
+if __name__ == '__main__':
+    bench_store_memory()
+    bench_graph_bulk_load()
+    bench_bulk_edit()
+    bench_io()
+    bench_retweet_memory()
+    bench_text_search()
+    bench_registry()
+    bench_leaderboard()
@@ -0,0 +1,193 @@
+"""CSC148 Lab 2: Leaderboard
+
+=== CSC148 Winter 2025 ===
+Department of Computer Science,
+University of Toronto
+
+=== Module description ===
+This module contains Leaderboard, which keeps the recent scores of many
+players in one 2-D NumPy array (one row per player) so that averages, top
+scores, percentiles and rankings are computed for every player at once.
+
+Each row is a ring buffer with the same meaning as Player's history: only the
+most recent <capacity> scores of each player are kept.
+"""
+from __future__ import annotations
+from typing import Iterable
+
+import numpy as np
+
+from player import Player
+
+
+class Leaderboard:
+    """The recent scores of many players.
+
+    Attributes:
+    - names: the name of each player, in row order.
+    - capacity: the number of recent scores kept for each player.
+
+    Private Attributes:
+    - _rows: maps each player's name to their row.
+    - _scores: a (rows allocated) x capacity array. Score k of a player
+      (counting from 0, over all the scores they have ever had) is stored at
+      column k % capacity of their row.
+    - _counts: _counts[i] is the number of scores player i has ever had.
+
+    Representation Invariants:
+    - len(self.names) == len(self._rows) <= self._scores.shape[0]
+    - self._scores.shape[1] == self.capacity
+    - self._counts.shape == (self._scores.shape[0],)
+
+    >>> board = Leaderboard(capacity=3)
+    >>> board.add_scores('Diane', [10, 20, 30, 40])
+    >>> board.add_scores('David', [5, 50])
+    >>> board.averages(2).tolist()
+    [35.0, 27.5]
+    >>> board.top_scores().tolist()
+    [40.0, 50.0]
+    >>> board.ranking(2)
+    ['Diane', 'David']
+    >>> board.add_round([100, 0])
+    >>> board.history('David')
+    [5, 50, 0]
+    """
+    names: list[str]
+    capacity: int
+    _rows: dict[str, int]
+    _scores: np.ndarray
+    _counts: np.ndarray
+
+    def __init__(self, capacity: int = 100) -> None:
+        """Initialize an empty leaderboard that keeps the most recent
+        <capacity> scores of each player.
+        """
+        self.names = []
+        self.capacity = capacity
+        self._rows = {}
+        self._scores = np.zeros((16, capacity), dtype=np.int32)
+        self._counts = np.zeros(16, dtype=np.int64)
+
+    @classmethod
+    def from_players(cls, players: Iterable[Player], capacity: int = 100) -> Leaderboard:
+        """Return a new leaderboard holding the history of each of <players>.
+        """
+        board = cls(capacity)
+        for player in players:
+            board.add_scores(player.name, player.history)
+        return board
+
+    def __len__(self) -> int:
+        """Return the number of players on this leaderboard.
+        """
+        return len(self.names)
+
+    def add_player(self, name: str) -> int:
+        """Add a player called <name> with no scores, if there isn't one
+        already, and return their row.
+        """
+        row = self._rows.get(name)
+        if row is None:
+            row = len(self.names)
+            if row == self._scores.shape[0]:
+                self._scores = np.concatenate([self._scores, np.zeros_like(self._scores)])
+                self._counts = np.concatenate([self._counts, np.zeros_like(self._counts)])
+            self._rows[name] = row
+            self.names.append(name)
+        return row
+
+    def add_scores(self, name: str, scores: Iterable[int]) -> None:
+        """Add <scores> to the end of the history of the player called <name>,
+        adding the player if needed.
+        """
+        row = self.add_player(name)
+        scores = np.fromiter(scores, dtype=np.int32)[-self.capacity:]
+        count = self._counts[row]
+        self._scores[row, (count + np.arange(len(scores))) % self.capacity] = scores
+        self._counts[row] += len(scores)
+
+    def add_round(self, scores: Iterable[int]) -> None:
+        """Add one score for every player: scores[i] is added to the history
+        of player self.names[i].
+        """
+        n = len(self.names)
+        scores = np.fromiter(scores, dtype=np.int32, count=n)
+        self._scores[np.arange(n), self._counts[:n] % self.capacity] = scores
+        self._counts[:n] += 1
+
+    def history(self, name: str) -> list[int]:
+        """Return the kept scores of the player called <name>, oldest first.
+        """
+        row = self._rows[name]
+        count = int(self._counts[row])
+        kept = min(count, self.capacity)
+        return self._scores[row, np.arange(count - kept, count) % self.capacity].tolist()
+
+    def averages(self, n: int) -> np.ndarray:
+        """Return the average of each player's <n> most recent scores, in row
+        order. Players with fewer than <n> kept scores get nan.
+
+        Preconditions:
+        - 0 < n <= self.capacity
+        """
+        counts = self._counts[:len(self.names)]
+        columns = (counts[:, None] - 1 - np.arange(n)) % self.capacity
+        recent = np.take_along_axis(self._scores[:len(self.names)], columns, axis=1)
+        averages = recent.sum(axis=1, dtype=np.int64) / n
+        averages[counts < n] = np.nan
+        return averages
+
+    def top_scores(self) -> np.ndarray:
+        """Return each player's top kept score, in row order. Players with no
+        scores get nan.
+        """
+        counts = self._counts[:len(self.names)]
+        lowest = np.iinfo(self._scores.dtype).min
+        tops = np.where(self._kept(), self._scores[:len(self.names)], lowest).max(axis=1)
+        return np.where(counts > 0, tops, np.nan)
+
+    def percentiles(self, q: float | Iterable[float]) -> np.ndarray:
+        """Return the <q>-th percentile(s) of each player's kept scores, in row
+        order, interpolating linearly between scores like np.percentile.
+        If <q> is a sequence, the result has one column per value.
+        Players with no scores get nan.
+
+        Preconditions:
+        - every value in q is between 0 and 100
+        """
+        counts = np.minimum(self._counts[:len(self.names)], self.capacity)
+        highest = np.iinfo(self._scores.dtype).max
+        ordered = np.sort(np.where(self._kept(), self._scores[:len(self.names)], highest),
+                          axis=1).astype(np.float64)
+        positions = (np.maximum(counts, 1) - 1)[:, None] * (np.atleast_1d(q) / 100)
+        below = np.floor(positions).astype(np.int64)
+        above = np.ceil(positions).astype(np.int64)
+        low = np.take_along_axis(ordered, below, axis=1)
+        high = np.take_along_axis(ordered, above, axis=1)
+        result = low + (high - low) * (positions - below)
+        result[counts == 0] = np.nan
+        return result if np.ndim(q) else result[:, 0]
+
+    def ranking(self, n: int) -> list[str]:
+        """Return the names of every player with at least <n> scores, from the
+        highest average of their <n> most recent scores to the lowest.
+
+        Players with equal averages are ordered by row.
+        """
+        averages = self.averages(n)
+        ranked = np.flatnonzero(~np.isnan(averages))
+        ranked = ranked[np.argsort(-averages[ranked], kind='stable')]
+        return [self.names[i] for i in ranked.tolist()]
+
+    def _kept(self) -> np.ndarray:
+        """Return a boolean array, the same shape as the used rows of
+        self._scores, that is True exactly where a kept score is stored.
+        """
+        counts = self._counts[:len(self.names)]
+        return np.arange(self.capacity) < np.minimum(counts, self.capacity)[:, None]
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -1,29 +1,99 @@
+from array import array
+from collections import deque
+
+
 class Player:
     """
     A class that holds the scores of the player
 
+    Only the most recent <capacity> scores are kept. They are stored in a
+    fixed-size ring buffer, so adding a score never moves the others.
+
+    Running sums and monotonic deques are kept alongside the scores, so the
+    average of any number of recent scores, the top score and the lowest
+    score all take O(1) time.
+
     >>> player1 = Player('001')
     >>> player1.add_scores([10,20,24,25,26])
     >>> player1.get_average(3)
-    25
+    25.0
     >>> player1.get_top_score()
     26
+    >>> player1.get_lowest_score()
+    10
+    >>> player2 = Player('002', capacity=3)
+    >>> player2.add_scores([9,2,3,4])
+    >>> player2.history
+    [2, 3, 4]
+    >>> player2.get_top_score()
+    4
     """
     name: str
-    history: [int]
+    capacity: int
+    _scores: array
+    _start: int
+    _size: int
+    _count: int
+    _prefix: array
+    _maxima: deque
+    _minima: deque
+
+    # _count is the number of scores ever added. _prefix[k % (capacity + 1)]
+    # is the sum of the first k scores ever added, for the last capacity + 1
+    # values of k. _maxima and _minima hold (k, score) pairs for the kept
+    # scores, where the score is the k-th one ever added (counting from 0);
+    # scores in _maxima are strictly decreasing, and in _minima strictly
+    # increasing, so their first entries are the top and lowest scores.
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, capacity: int = 100):
         self.name = name
-        self.history = []
+        self.capacity = capacity
+        self._scores = array('i', [0]) * capacity
+        self._start = 0
+        self._size = 0
+        self._count = 0
+        self._prefix = array('q', [0]) * (capacity + 1)
+        self._maxima = deque()
+        self._minima = deque()
+
+    @property
+    def history(self) -> [int]:
+        """
+        The kept scores, oldest first
+        """
+        end = self._start + self._size
+        if end <= self.capacity:
+            return self._scores[self._start:end].tolist()
+        return (self._scores[self._start:] + self._scores[:end - self.capacity]).tolist()
 
     def add_scores(self,scores: [int]):
         """
-        Adds scores to the end of history list, if the number of scores exceed 100, remove the first n elements required
+        Adds scores to the end of history, if the number of scores exceeds capacity, the oldest scores are overwritten
         """
-        self.history.extend(scores)
-        if len(self.history) > 100:
-            excess = len(self.history) - 100
-            self.history = self.history[excess:]
+        for score in scores:
+            if self._size < self.capacity:
+                self._scores[(self._start + self._size) % self.capacity] = score
+                self._size += 1
+            else:
+                self._scores[self._start] = score
+                self._start = (self._start + 1) % self.capacity
+
+            k = self._count
+            self._prefix[(k + 1) % (self.capacity + 1)] = \
+                self._prefix[k % (self.capacity + 1)] + score
+            self._count += 1
+
+            oldest = self._count - self._size
+            while self._maxima and self._maxima[-1][1] <= score:
+                self._maxima.pop()
+            self._maxima.append((k, score))
+            if self._maxima[0][0] < oldest:
+                self._maxima.popleft()
+            while self._minima and self._minima[-1][1] >= score:
+                self._minima.pop()
+            self._minima.append((k, score))
+            if self._minima[0][0] < oldest:
+                self._minima.popleft()
 
     def get_average(self, n: int):
         """
@@ -31,7 +101,16 @@ class Player:
 
         Precondition: n must not be larger than the number of scores
         """
-        return sum(self.history[-n:])/n
+        end = self._count % (self.capacity + 1)
+        start = (self._count - n) % (self.capacity + 1)
+        return (self._prefix[end] - self._prefix[start])/n
 
     def get_top_score(self) -> int:
-        return max(self.history)
+        if not self._maxima:
+            raise ValueError('no scores')
+        return self._maxima[0][1]
+
+    def get_lowest_score(self) -> int:
+        if not self._minima:
+            raise ValueError('no scores')
+        return self._minima[0][1]
@@ -0,0 +1,122 @@
+"""CSC148 Lab 2: Thread-safe user registry
+
+=== CSC148 Winter 2025 ===
+Department of Computer Science,
+University of Toronto
+
+=== Module description ===
+This module contains UserRegistry, which holds users by userid and lets many
+threads tweet, like and edit at the same time without losing updates.
+
+Users are split into shards by userid, and each shard has its own lock. A
+tweet is always changed while holding the lock of its author's shard, so no
+like or tweet is ever lost, and two threads never wait for each other's shard
+locks unless they touch users in the same shard.
+
+This does not make throughput grow with the number of threads. CPython's
+global interpreter lock still runs one thread at a time, and users who share
+a TrendingIndex or TextIndex also take that index's single lock on every
+like, tweet or edit. Use processes, not threads, to use more than one core.
+"""
+from __future__ import annotations
+import threading
+
+from tweet import Tweet, User
+
+
+class UserRegistry:
+    """A collection of users, keyed by userid, that is safe to use from many
+    threads at once.
+
+    Private Attributes:
+    - _shards: the users in each shard, keyed by userid.
+    - _locks: _locks[i] is the lock that guards _shards[i] and every user in
+      it, including their tweets.
+
+    Representation Invariants:
+    - len(self._shards) == len(self._locks) > 0
+    - every user is in the shard given by self._shard_of(user.userid)
+
+    >>> registry = UserRegistry()
+    >>> registry.add_user(User('David', 'okay laugh'))
+    >>> t = registry.tweet('David', 'David is so cool')
+    >>> registry.like(t, 3)
+    >>> registry.get('David').tweets[0].likes
+    3
+    >>> 'David' in registry
+    True
+    """
+    _shards: list[dict[str, User]]
+    _locks: list[threading.Lock]
+
+    def __init__(self, num_shards: int = 64) -> None:
+        """Initialize an empty registry with <num_shards> shards.
+
+        Preconditions:
+        - num_shards > 0
+        """
+        self._shards = [{} for _ in range(num_shards)]
+        self._locks = [threading.Lock() for _ in range(num_shards)]
+
+    def __contains__(self, userid: str) -> bool:
+        """Return whether a user with id <userid> is in this registry.
+        """
+        return userid in self._shards[self._shard_of(userid)]
+
+    def __len__(self) -> int:
+        """Return the number of users in this registry.
+        """
+        return sum(len(shard) for shard in self._shards)
+
+    def add_user(self, user: User) -> None:
+        """Add <user> to this registry.
+
+        Raise ValueError if a user with the same userid is already in it.
+        """
+        i = self._shard_of(user.userid)
+        with self._locks[i]:
+            if user.userid in self._shards[i]:
+                raise ValueError(f'userid {user.userid!r} is already registered')
+            self._shards[i][user.userid] = user
+
+    def get(self, userid: str) -> User:
+        """Return the user with id <userid>.
+
+        Raise KeyError if there is no such user.
+        """
+        return self._shards[self._shard_of(userid)][userid]
+
+    def tweet(self, userid: str, message: str) -> Tweet:
+        """Record that the user with id <userid> made a tweet with the given
+        content, and return the new tweet.
+
+        Raise KeyError if there is no such user.
+        """
+        i = self._shard_of(userid)
+        with self._locks[i]:
+            user = self._shards[i][userid]
+            user.tweet(message)
+            return user.tweets[-1]
+
+    def like(self, tweet: Tweet, n: int) -> None:
+        """Record that <tweet> received <n> more likes.
+        """
+        with self._locks[self._shard_of(tweet.userid)]:
+            tweet.like(n)
+
+    def edit(self, tweet: Tweet, new_content: str) -> None:
+        """Replace the contents of <tweet> with <new_content>.
+        """
+        with self._locks[self._shard_of(tweet.userid)]:
+            tweet.edit(new_content)
+
+    def _shard_of(self, userid: str) -> int:
+        """Return the index of the shard that holds the user with id <userid>.
+        """
+        return hash(userid) % len(self._shards)
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,150 @@
+"""CSC148 Lab 2: Social graph
+
+=== CSC148 Winter 2025 ===
+Department of Computer Science,
+University of Toronto
+
+=== Module description ===
+This module contains SocialGraph, which records who follows whom.
+Both directions of every edge are kept in dicts used as ordered sets (every
+value is None), so following, unfollowing and checking whether one user
+follows another all take O(1) average time, and so does finding the followers
+of a user (not just the users they follow). Users are listed in the order
+they were followed, so the order is the same from run to run.
+
+The users in a graph can be any hashable objects, such as userids. User in
+tweet.py keeps its own follows and followers instead, so that they are freed
+along with it; a SocialGraph is for graphs loaded or analysed in bulk, where
+add_edges is much faster than following one edge at a time.
+"""
+from __future__ import annotations
+from typing import Hashable, Iterable
+
+
+class SocialGraph:
+    """A directed "follows" graph.
+
+    Private Attributes:
+    - _following: maps each user to the users they follow, as the keys of a
+      dict in the order they were followed.
+    - _followers: maps each user to the users who follow them, as the keys
+      of a dict in the order they followed.
+
+    Representation Invariants:
+    - every b in self._following[a] has a in self._followers[b], and
+      vice versa
+    - no dict in self._following or self._followers is empty
+    - every value in the dicts in self._following and self._followers is None
+
+    Sample Usage:
+
+    >>> graph = SocialGraph()
+    >>> graph.follow('Diane', 'David')
+    >>> graph.follow('Diane', 'David')
+    >>> graph.following('Diane')
+    ['David']
+    >>> graph.followers_of('David')
+    ['Diane']
+    >>> graph.is_mutual('Diane', 'David')
+    False
+    >>> graph.follow('David', 'Diane')
+    >>> graph.is_mutual('Diane', 'David')
+    True
+    >>> graph.unfollow('Diane', 'David')
+    >>> graph.is_following('Diane', 'David')
+    False
+    >>> graph.followers_of('David')
+    []
+    """
+    _following: dict[Hashable, dict[Hashable, None]]
+    _followers: dict[Hashable, dict[Hashable, None]]
+
+    def __init__(self) -> None:
+        """Initialize a new graph with no users.
+        """
+        self._following = {}
+        self._followers = {}
+
+    def follow(self, follower: Hashable, followee: Hashable) -> None:
+        """Record that <follower> follows <followee>.
+
+        Following someone twice has no additional effect.
+        """
+        if followee not in self._following.get(follower, ()):
+            self._following.setdefault(follower, {})[followee] = None
+            self._followers.setdefault(followee, {})[follower] = None
+
+    def unfollow(self, follower: Hashable, followee: Hashable) -> None:
+        """Record that <follower> no longer follows <followee>.
+
+        Do nothing if <follower> does not follow <followee>.
+        """
+        followees = self._following.get(follower)
+        if followees is None or followee not in followees:
+            return
+        del followees[followee]
+        if not followees:
+            del self._following[follower]
+        followers = self._followers[followee]
+        del followers[follower]
+        if not followers:
+            del self._followers[followee]
+
+    def is_following(self, follower: Hashable, followee: Hashable) -> bool:
+        """Return whether <follower> follows <followee>.
+        """
+        return followee in self._following.get(follower, ())
+
+    def is_mutual(self, a: Hashable, b: Hashable) -> bool:
+        """Return whether <a> and <b> follow each other.
+        """
+        return self.is_following(a, b) and self.is_following(b, a)
+
+    def following(self, user: Hashable) -> list:
+        """Return a list of the users <user> follows, in the order they were
+        followed.
+        """
+        return list(self._following.get(user, ()))
+
+    def followers_of(self, user: Hashable) -> list:
+        """Return a list of the users who follow <user>, in the order they
+        followed.
+        """
+        return list(self._followers.get(user, ()))
+
+    def add_edges(self, pairs: Iterable[tuple[Hashable, Hashable]]) -> int:
+        """Record every (follower, followee) pair in <pairs> and return the
+        number of pairs that were not already in this graph.
+
+        This is the bulk-load path: it works through <pairs> lazily and avoids
+        the per-edge method calls of follow.
+
+        >>> graph = SocialGraph()
+        >>> graph.add_edges([('a', 'b'), ('a', 'c'), ('b', 'a'), ('a', 'b')])
+        3
+        >>> graph.following('a')
+        ['b', 'c']
+        """
+        following = self._following
+        followers = self._followers
+        added = 0
+        for follower, followee in pairs:
+            followees = following.get(follower)
+            if followees is None:
+                followees = following[follower] = {}
+            elif followee in followees:
+                continue
+            followees[followee] = None
+            back = followers.get(followee)
+            if back is None:
+                followers[followee] = {follower: None}
+            else:
+                back[follower] = None
+            added += 1
+        return added
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,214 @@
+"""CSC148 Lab 2: Full-text search over tweets
+
+=== CSC148 Winter 2025 ===
+Department of Computer Science,
+University of Toronto
+
+=== Module description ===
+This module contains TextIndex, an inverted index from words to the tweets
+that contain them. Searching for a word only looks at the tweets that contain
+it, instead of checking the content of every tweet. The tweets containing each
+word are also grouped by date, so a search restricted to a range of dates only
+looks at the tweets from those dates.
+
+Words are maximal runs of letters, digits and underscores, compared
+case-insensitively.
+"""
+from __future__ import annotations
+import re
+import threading
+from bisect import bisect_left, bisect_right, insort
+from datetime import date
+from typing import Any, Iterable
+
+_WORD = re.compile(r'\w+')
+
+
+def tokens(content: str) -> set[str]:
+    """Return the set of words in <content>, in lowercase.
+
+    >>> sorted(tokens('David is so cool! SO cool.'))
+    ['cool', 'david', 'is', 'so']
+    """
+    return set(_WORD.findall(content.lower()))
+
+
+class TextIndex:
+    """An inverted index over the content of tweets.
+
+    Every tweet added to the index is given an id; the postings of a word are
+    the ids of the tweets whose content contains that word, grouped by the
+    date the tweets were created.
+
+    Private Attributes:
+    - _ids: maps each tweet in the index to its id.
+    - _tweets: maps each id to its tweet.
+    - _postings: maps each word to a dict that maps each date to the ids of
+      the tweets created on that date that contain the word.
+    - _days: maps each word to the dates in its postings, in sorted order.
+    - _next_id: the id to give the next tweet added.
+    - _lock: held while changing or searching the index, so that tweets can
+      be added and edited from several threads at once.
+
+    Representation Invariants:
+    - len(self._ids) == len(self._tweets)
+    - self._days.keys() == self._postings.keys()
+    - all(self._days[w] == sorted(self._postings[w]) for w in self._days)
+    - no dict in self._postings is empty, and none of their sets are empty
+
+    >>> from tweet import Tweet
+    >>> index = TextIndex()
+    >>> t1 = Tweet('David', date(2017, 8, 19), 'David is so cool')
+    >>> t2 = Tweet('Diane', date(2017, 8, 20), 'Diane is cool too')
+    >>> index.add(t1)
+    >>> index.add(t2)
+    >>> [t.userid for t in index.search(['cool'])]
+    ['David', 'Diane']
+    >>> [t.userid for t in index.search(['cool', 'too'])]
+    ['Diane']
+    >>> [t.userid for t in index.search(['david', 'diane'], match_all=False)]
+    ['David', 'Diane']
+    >>> [t.userid for t in index.search(['cool'], since=date(2017, 8, 20))]
+    ['Diane']
+    """
+    _ids: dict[Any, int]
+    _tweets: dict[int, Any]
+    _postings: dict[str, dict[date, set[int]]]
+    _days: dict[str, list[date]]
+    _next_id: int
+    _lock: threading.Lock
+
+    def __init__(self) -> None:
+        """Initialize an empty index.
+        """
+        self._ids = {}
+        self._tweets = {}
+        self._postings = {}
+        self._days = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def __contains__(self, tweet: Any) -> bool:
+        """Return whether <tweet> is in this index.
+        """
+        return tweet in self._ids
+
+    def add(self, tweet: Any) -> None:
+        """Add <tweet> to this index.
+
+        Do nothing if <tweet> is already in this index.
+        """
+        words = tokens(tweet.content)
+        with self._lock:
+            if tweet in self._ids:
+                return
+            tweet_id = self._next_id
+            self._next_id += 1
+            self._ids[tweet] = tweet_id
+            self._tweets[tweet_id] = tweet
+            for word in words:
+                self._post(word, tweet.created_at, tweet_id)
+
+    def update(self, tweet: Any, old_content: str) -> None:
+        """Record that the content of <tweet> changed from <old_content> to
+        tweet.content.
+
+        Do nothing if <tweet> is not in this index.
+        """
+        self.update_many([(tweet, old_content)], tweet.content)
+
+    def update_many(self, edits: Iterable[tuple[Any, str]], new_content: str) -> None:
+        """Record that the content of every tweet in <edits> changed from the
+        old content paired with it to <new_content>.
+
+        <new_content> is only split into words once, and the lock is only
+        taken once for all of <edits>. Tweets not in this index are skipped.
+        """
+        new_words = tokens(new_content)
+        edits = [(tweet, tokens(old_content)) for tweet, old_content in edits]
+        with self._lock:
+            for tweet, old_words in edits:
+                tweet_id = self._ids.get(tweet)
+                if tweet_id is None:
+                    continue
+                for word in old_words - new_words:
+                    self._unpost(word, tweet.created_at, tweet_id)
+                for word in new_words - old_words:
+                    self._post(word, tweet.created_at, tweet_id)
+
+    def search(self, terms: Iterable[str], match_all: bool = True,
+               since: date | None = None, until: date | None = None) -> list:
+        """Return the tweets that contain every word in <terms> (or, if
+        <match_all> is False, at least one of them), in the order they were
+        added to this index.
+
+        If <since> or <until> is given, only return tweets created on or
+        after <since> and on or before <until>.
+
+        The time taken depends on the number of tweets in the date range that
+        contain the terms (for match_all, only the rarest term), not on the
+        number of tweets in the index.
+        """
+        words = [word for term in terms for word in tokens(term)]
+        if not words:
+            return []
+        with self._lock:
+            found = [(self._between(word, since, until), word) for word in words]
+            if match_all:
+                # Check each candidate of the rarest word against the other
+                # words' postings for the candidate's date.
+                found.sort(key=lambda pair: sum(map(len, pair[0])))
+                others = [self._postings.get(word, {}) for _, word in found[1:]]
+                ids = [tweet_id for ids in found[0][0] for tweet_id in ids
+                       if all(tweet_id in other.get(self._tweets[tweet_id].created_at, ())
+                              for other in others)]
+            else:
+                ids = set().union(*(ids for days, _ in found for ids in days))
+            return [self._tweets[tweet_id] for tweet_id in sorted(ids)]
+
+    def _between(self, word: str, since: date | None, until: date | None) -> list[set[int]]:
+        """Return the postings of <word> for each date from <since> to
+        <until> inclusive (from the first or to the last date if None).
+        """
+        days = self._days.get(word)
+        if days is None:
+            return []
+        start = 0 if since is None else bisect_left(days, since)
+        stop = len(days) if until is None else bisect_right(days, until)
+        postings = self._postings[word]
+        return [postings[day] for day in days[start:stop]]
+
+    def _post(self, word: str, day: date, tweet_id: int) -> None:
+        """Record that the tweet with id <tweet_id>, created on <day>,
+        contains <word>.
+        """
+        postings = self._postings.get(word)
+        if postings is None:
+            postings = self._postings[word] = {}
+            self._days[word] = []
+        ids = postings.get(day)
+        if ids is None:
+            ids = postings[day] = set()
+            insort(self._days[word], day)
+        ids.add(tweet_id)
+
+    def _unpost(self, word: str, day: date, tweet_id: int) -> None:
+        """Record that the tweet with id <tweet_id>, created on <day>, no
+        longer contains <word>.
+        """
+        postings = self._postings[word]
+        ids = postings[day]
+        ids.discard(tweet_id)
+        if not ids:
+            del postings[day]
+            days = self._days[word]
+            del days[bisect_left(days, day)]
+            if not postings:
+                del self._postings[word]
+                del self._days[word]
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,217 @@
+"""CSC148 Lab 2: Trending tweets
+
+=== CSC148 Winter 2025 ===
+Department of Computer Science,
+University of Toronto
+
+=== Module description ===
+This module contains TrendingIndex, which keeps track of the most-liked
+tweets overall and for each recent day. It is updated every time a tweet is
+liked, so finding the most-liked tweets never needs to look at every tweet.
+"""
+from __future__ import annotations
+import threading
+from datetime import date
+from heapq import heapify, heappop, heappush
+from typing import Any, Hashable
+
+
+class TopK:
+    """The (at most) k items with the highest scores among those recorded.
+
+    Scores are expected to only increase: if the score of an item in the top k
+    decreases, an item that was previously pushed out is not brought back.
+
+    Private Attributes:
+    - _k: the maximum number of items kept.
+    - _scores: maps each item currently in the top k to its score.
+    - _heap: a min-heap of (score, seq, item) entries. An entry is stale, and
+      ignored, unless seq == self._latest[item].
+    - _latest: maps each item in _scores to the seq of its newest heap entry.
+    - _seq: the seq to give the next heap entry.
+
+    Representation Invariants:
+    - self._k > 0
+    - len(self._scores) <= self._k
+    - self._scores.keys() == self._latest.keys()
+
+    >>> top = TopK(2)
+    >>> top.record('a', 5)
+    >>> top.record('b', 1)
+    >>> top.record('c', 3)
+    >>> top.items()
+    ['a', 'c']
+    >>> top.record('b', 10)
+    >>> top.items()
+    ['b', 'a']
+    """
+    _k: int
+    _scores: dict[Hashable, int]
+    _heap: list[tuple[int, int, Any]]
+    _latest: dict[Hashable, int]
+    _seq: int
+
+    def __init__(self, k: int) -> None:
+        """Initialize an empty TopK that keeps at most <k> items.
+        """
+        self._k = k
+        self._scores = {}
+        self._heap = []
+        self._latest = {}
+        self._seq = 0
+
+    def __len__(self) -> int:
+        """Return the number of items currently in the top k.
+        """
+        return len(self._scores)
+
+    def record(self, item: Hashable, score: int) -> None:
+        """Record that <item> now has score <score>.
+
+        This takes O(log k) amortized time.
+        """
+        if item in self._scores:
+            self._push(item, score)
+        elif len(self._scores) < self._k:
+            self._push(item, score)
+        else:
+            self._drop_stale()
+            if score > self._heap[0][0]:
+                _, _, smallest = heappop(self._heap)
+                del self._scores[smallest]
+                del self._latest[smallest]
+                self._push(item, score)
+        if len(self._heap) > 2 * self._k + 16:
+            self._rebuild()
+
+    def items(self, n: int | None = None) -> list:
+        """Return the <n> items with the highest scores (all of them if <n> is
+        None), highest first.
+
+        Items with equal scores are returned in the order they reached that
+        score. This takes O(k log k) time.
+        """
+        entries = sorted(((score, -self._latest[item], item)
+                          for item, score in self._scores.items()),
+                         key=lambda entry: entry[:2], reverse=True)
+        return [item for _, _, item in entries[:n]]
+
+    def _push(self, item: Hashable, score: int) -> None:
+        """Add a heap entry for <item> with score <score>.
+        """
+        self._scores[item] = score
+        self._latest[item] = self._seq
+        heappush(self._heap, (score, self._seq, item))
+        self._seq += 1
+
+    def _drop_stale(self) -> None:
+        """Pop stale entries from the top of the heap.
+        """
+        heap = self._heap
+        while heap and self._latest.get(heap[0][2]) != heap[0][1]:
+            heappop(heap)
+
+    def _rebuild(self) -> None:
+        """Rebuild the heap from its live entries only.
+        """
+        self._heap = [(self._scores[item], seq, item)
+                      for item, seq in self._latest.items()]
+        heapify(self._heap)
+
+
+class TrendingIndex:
+    """The most-liked tweets overall and for each of the most recent days.
+
+    Private Attributes:
+    - _k: the number of tweets kept for each day and overall.
+    - _max_days: the number of days, counting back from the newest tweet
+      date recorded, for which a per-day top k is kept.
+    - _overall: the most-liked tweets of all time.
+    - _days: maps each recent date to the most-liked tweets written that day.
+    - _newest: the newest tweet date recorded so far, or None.
+    - _lock: held while reading or changing any of the above, so that tweets
+      can be liked from several threads at once.
+
+    Representation Invariants:
+    - self._k > 0
+    - self._max_days > 0
+    - len(self._days) <= self._max_days
+
+    >>> from tweet import Tweet
+    >>> index = TrendingIndex(k=2, max_days=2)
+    >>> t1 = Tweet('Rukhsana', date(2017, 9, 16), 'Hey!')
+    >>> t2 = Tweet('David', date(2017, 9, 17), 'David is so cool')
+    >>> t3 = Tweet('Diane', date(2017, 9, 18), 'Diane is cool')
+    >>> for t, likes in [(t1, 10), (t2, 5), (t3, 7)]:
+    ...     t.likes = likes
+    ...     index.record(t)
+    >>> [t.userid for t in index.top()]
+    ['Rukhsana', 'Diane']
+    >>> [t.userid for t in index.top(date(2017, 9, 17))]
+    ['David']
+    >>> index.top(date(2017, 9, 16))
+    []
+    """
+    _k: int
+    _max_days: int
+    _overall: TopK
+    _days: dict[date, TopK]
+    _newest: date | None
+    _lock: threading.Lock
+
+    def __init__(self, k: int = 100, max_days: int = 7) -> None:
+        """Initialize an empty index that keeps the <k> most-liked tweets
+        overall and for each of the last <max_days> days.
+        """
+        self._k = k
+        self._max_days = max_days
+        self._overall = TopK(k)
+        self._days = {}
+        self._newest = None
+        self._lock = threading.Lock()
+
+    def record(self, tweet: Any) -> None:
+        """Record that <tweet> now has tweet.likes likes.
+
+        Per-day counts are only kept for the last self._max_days days; days
+        older than that are evicted as newer ones arrive.
+        """
+        with self._lock:
+            likes = tweet.likes
+            self._overall.record(tweet, likes)
+            day = tweet.created_at
+            top = self._days.get(day)
+            if top is None:
+                if self._newest is not None and \
+                        (self._newest - day).days >= self._max_days:
+                    return
+                top = self._days[day] = TopK(self._k)
+                if self._newest is None or day > self._newest:
+                    self._newest = day
+                    self._evict()
+            top.record(tweet, likes)
+
+    def top(self, day: date | None = None, n: int | None = None) -> list:
+        """Return the <n> most-liked tweets written on <day>, or of all time if
+        <day> is None, most-liked first. Return all that are kept if <n> is
+        None.
+
+        Return an empty list if <day> is not one of the days kept.
+        """
+        with self._lock:
+            if day is None:
+                return self._overall.items(n)
+            top = self._days.get(day)
+            return [] if top is None else top.items(n)
+
+    def _evict(self) -> None:
+        """Remove the per-day counts of days that are now too old to keep.
+        """
+        for day in [d for d in self._days if (self._newest - d).days >= self._max_days]:
+            del self._days[day]
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -10,8 +10,29 @@ as way to introduce the major concepts of object-oriented programming.
 """
 # Allows forward references in type annotations.
 from __future__ import annotations
+import os
+from bisect import bisect_left, bisect_right
 from datetime import date  # Python library for working with dates (and times)
-from python_ta.contracts import check_contracts
+from heapq import merge
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator
+
+
+def _no_contracts(obj: Any) -> Any:
+    """Return <obj> unchanged, without adding any contract checks."""
+    return obj
+
+
+# Contract checking is on unless the CHECK_CONTRACTS environment variable is
+# set to 0. python_ta is slow to import, so it is only imported (and only
+# needs to be installed) when checking is on. If checking is on and python_ta
+# is missing, importing this module fails rather than silently not checking.
+check_contracts = _no_contracts
+if os.environ.get('CHECK_CONTRACTS', '1') != '0':
+    from python_ta.contracts import check_contracts
+
+from text_index import TextIndex
+from trending import TrendingIndex
 
 
 @check_contracts
@@ -24,6 +45,12 @@ class Tweet:
     - created_at: the date the tweet was written.
     - likes: the number of likes this tweet has received.
 
+    Private Attributes:
+    - _owner: the User whose tweets this tweet belongs to, or None if it has
+      not been recorded by any User. Used to keep the owner's verbosity
+      index and text index up to date when this tweet is edited, and the
+      owner's trending index up to date when it is liked.
+
     Representation Invariants:
     - len(self.content) <= 280
 
@@ -53,6 +80,7 @@ class Tweet:
     userid: str
     created_at: date
     likes: int
+    _owner: User | None
 
     def __init__(self, who: str, when: date, what: str) -> None:
         """Initialize a new Tweet.
@@ -71,28 +99,47 @@ class Tweet:
         self.userid = who
         self.created_at = when
         self.likes = 0
+        self._owner = None
 
     def like(self, n: int) -> None:
         """Record the fact that this tweet received <n> likes.
 
-        These likes are in addition to the ones <self> already has.
+        These likes are in addition to the ones <self> already has. If this
+        tweet belongs to a User with a trending index, it is updated too.
 
         >>> t = Tweet('Rukhsana', date(2017, 9, 16), 'Hey!')
         >>> t.like(3)
         >>> t.likes
         3
+        >>> index = TrendingIndex()
+        >>> u = User('Rukhsana', 'Roller coaster fanatic', trending=index)
+        >>> u.add_tweet(t)
+        >>> t.like(1)
+        >>> index.top() == [t]
+        True
         """
         self.likes += n
+        owner = self._owner
+        if owner is not None and owner.trending is not None:
+            owner.trending.record(self)
 
     def edit(self, new_content: str) -> None:
         """Replace the contents of this tweet with the new message.
 
+        If this tweet belongs to a User with a text index, it is updated too.
+
         >>> t = Tweet('Rukhsana', date(2017, 9, 16), 'Hey!')
         >>> t.edit('Rukhsana is cool')
         >>> t.content
         'Rukhsana is cool'
         """
+        old_content = self.content
         self.content = new_content
+        if self._owner is not None:
+            self._owner._add_verbosity(self.created_at.year,
+                                       len(new_content) - len(old_content))
+            if self._owner.text_index is not None:
+                self._owner.text_index.update(self, old_content)
 
 
 @check_contracts
@@ -102,18 +149,51 @@ class User:
     Attributes:
     - userid: the userid of this Twitter user.
     - bio: the bio of this Twitter user.
-    - follows: a list of the other users who this Twitter user follows.
+    - follows: a list of the other users who this Twitter user follows, in
+      the order they were followed. This is a new list each time it is
+      accessed, so changing it has no effect; use follow and unfollow
+      instead.
+    - followers: a list of the other users who follow this Twitter user, in
+      the order they followed.
     - tweets: a list of the tweets that this user has made.
+    - trending: the index that likes of this user's tweets are recorded in,
+      or None if they are not recorded anywhere. Several users can share
+      one index to find the most-liked tweets among all of them.
+    - text_index: the index that this user's tweets are recorded in for
+      full-text search, or None if they are not indexed. Several users can
+      share one index to search the tweets of all of them.
+
+    Private Attributes:
+    - _verbosity: maps each year to the total number of characters in this
+      user's tweets from that year. Kept up to date by tweet, Tweet.edit and
+      hack so that verbosity does not need to scan self.tweets.
+    - _follows: the users this user follows, as the keys of a dict in the
+      order they were followed (every value is None), so that follow,
+      unfollow and is_following take O(1) average time.
+    - _followers: the users who follow this user, kept the same way as
+      _follows and updated along with it.
+
+    Representation Invariants:
+    - all(self in other._followers for other in self._follows)
+    - all(self in other._follows for other in self._followers)
     """
     # Attribute types
     userid: str
     bio: str
-    follows: list[User]
     tweets: list[Tweet]
-
-    def __init__(self, id_: str, bio: str) -> None:
+    trending: TrendingIndex | None
+    text_index: TextIndex | None
+    _verbosity: dict[int, int]
+    _follows: dict[User, None]
+    _followers: dict[User, None]
+
+    def __init__(self, id_: str, bio: str, trending: TrendingIndex | None = None,
+                 text_index: TextIndex | None = None) -> None:
         """Initialize this User.
 
+        Likes of the user's tweets are recorded in <trending>, and the tweets
+        themselves in <text_index>, if given.
+
         >>> u = User('Rukhsana', 'Roller coaster fanatic')
         >>> u.userid
         'Rukhsana'
@@ -126,8 +206,12 @@ class User:
         """
         self.userid = id_
         self.bio = bio
-        self.follows = []
         self.tweets = []
+        self.trending = trending
+        self.text_index = text_index
+        self._verbosity = {}
+        self._follows = {}
+        self._followers = {}
 
     def tweet(self, message: str) -> None:
         """Record that this User made a tweet with the given content.
@@ -141,20 +225,98 @@ class User:
         2
         """
         new_tweet = Tweet(self.userid, date.today(), message)
-        self.tweets.append(new_tweet)
+        self.add_tweet(new_tweet)
+
+    def add_tweet(self, tweet: Tweet) -> None:
+        """Record that this User made <tweet>, which already exists (e.g. it
+        was loaded from a file).
+
+        Tweets must be added in date order, oldest first. <tweet> is added to
+        self.text_index, and any likes it already has are recorded in
+        self.trending, if this User has them.
+
+        Preconditions:
+        - tweet.userid == self.userid
+        - self.tweets == [] or self.tweets[-1].created_at <= tweet.created_at
+
+        >>> index = TextIndex()
+        >>> u1 = User('Rukhsana', 'Roller coaster fanatic', text_index=index)
+        >>> t = Tweet('Rukhsana', date(2017, 9, 16), 'Hey!')
+        >>> u1.add_tweet(t)
+        >>> u1.verbosity(2017)
+        4
+        >>> index.search(['hey'], until=date(2017, 9, 16)) == [t]
+        True
+        """
+        tweet._owner = self
+        self.tweets.append(tweet)
+        if tweet.likes and self.trending is not None:
+            self.trending.record(tweet)
+        self._add_verbosity(tweet.created_at.year, len(tweet.content))
+        if self.text_index is not None:
+            self.text_index.add(tweet)
+
+    def _add_verbosity(self, y: int, n: int) -> None:
+        """Add <n> characters to the verbosity index for year <y>.
+        """
+        self._verbosity[y] = self._verbosity.get(y, 0) + n
+
+    @property
+    def follows(self) -> list[User]:
+        """The other users who this User follows."""
+        return list(self._follows)
+
+    @property
+    def followers(self) -> list[User]:
+        """The other users who follow this User."""
+        return list(self._followers)
 
     def follow(self, other: User) -> None:
         """Record that this User follows <other>.
 
+        Following the same user more than once has no additional effect.
+
         >>> u1 = User('Rukhsana', 'Roller coaster fanatic')
         >>> u2 = User('POTUS', 'USA!!!')
         >>> u1.follow(u2)
+        >>> u1.follow(u2)
         >>> len(u1.follows)
         1
         >>> len(u2.follows)
         0
+        >>> u2.followers == [u1]
+        True
         """
-        self.follows.append(other)
+        if other not in self._follows:
+            self._follows[other] = None
+            other._followers[self] = None
+
+    def unfollow(self, other: User) -> None:
+        """Record that this User no longer follows <other>.
+
+        >>> u1 = User('Rukhsana', 'Roller coaster fanatic')
+        >>> u2 = User('POTUS', 'USA!!!')
+        >>> u1.follow(u2)
+        >>> u1.unfollow(u2)
+        >>> u1.is_following(u2)
+        False
+        """
+        if other in self._follows:
+            del self._follows[other]
+            del other._followers[self]
+
+    def is_following(self, other: User) -> bool:
+        """Return whether this User follows <other>.
+
+        >>> u1 = User('Rukhsana', 'Roller coaster fanatic')
+        >>> u2 = User('POTUS', 'USA!!!')
+        >>> u1.follow(u2)
+        >>> u1.is_following(u2)
+        True
+        >>> u2.is_following(u1)
+        False
+        """
+        return other in self._follows
 
     def verbosity(self, y: int) -> int:
         """Return the number of characters in this User's tweets in year <y>.
@@ -166,23 +328,51 @@ class User:
         25
         >>> u1.verbosity(2015)
         0
+        >>> u1.tweets[0].edit('Comet')
+        >>> u1.verbosity(date.today().year)
+        19
         """
-        # TODO: Implement this!
-        # Hint: look up the attributes of date, found here:
-        # https://docs.python.org/3/library/datetime.html#date-objects
-        total_chars = 0
-        for tweet in self.tweets:
-            if tweet.created_at.year == y:
-                total_chars += len(tweet.content)
-        return total_chars
+        return self._verbosity.get(y, 0)
 
+    def timeline(self, limit: int, before: Tweet | None = None) -> Iterator[Tweet]:
+        """Yield the <limit> most recent tweets made by the users this User
+        follows, newest first.
+
+        Tweets from the same date are ordered by userid (largest first), then
+        by user (in an arbitrary but fixed order) if several users followed
+        have the same userid, and tweets from the same user and date newest
+        first.
+
+        To get the next page of a timeline, pass the last tweet of the
+        previous page as <before>: only tweets that come after it are yielded.
+        Each page takes O(limit log k + k log n) time, where k is the number
+        of users followed and n the number of tweets each of them has made.
+
+        Preconditions:
+        - limit >= 0
+
+        >>> u1 = User('Rukhsana', 'Roller coaster fanatic')
+        >>> u2 = User('David', 'okay laugh')
+        >>> u3 = User('Diane', 'amazing laugh')
+        >>> u1.follow(u2)
+        >>> u1.follow(u3)
+        >>> u2.tweet('David is so cool')
+        >>> u2.tweet('David is even cooler')
+        >>> u3.tweet('Diane is cool')
+        >>> page = list(u1.timeline(2))
+        >>> [t.content for t in page]
+        ['Diane is cool', 'David is even cooler']
+        >>> [t.content for t in u1.timeline(2, before=page[-1])]
+        ['David is so cool']
+        """
+        sources = [_newest_first(other.tweets, _start(other, before))
+                   for other in self.follows]
+        return islice(merge(*sources, key=_timeline_key, reverse=True), limit)
 
     def hack(self) -> None:
         """Make every tweet made by every user this user follows say
         'mwahahaha'.
 
-        Use the Tweet.edit method.
-
         >>> u1 = User('Diane', 'amazing laugh')
         >>> u2 = User('David', 'okay laugh')
         >>> u1.follow(u2)
@@ -193,34 +383,140 @@ class User:
         >>> u2.tweets[0].content
         'mwahahaha'
         """
-        # TODO: implement this!
-        # get every user this user follows
-        # get their tweets
-        # change their tweet to mwahahaha
-
-        for followers in self.follows:
-            for tweet in followers.tweets:
-                tweet.edit('mwahahaha')
+        bulk_edit(self.follows, _every_tweet, 'mwahahaha')
 
 
-# TODO: Suppose we want to turn this function into a method.
-# Which class should we put it into? Once you've decided, move it.
-    def retweet(new_user: str, tweet: Tweet, new_date: date) -> Tweet:
-        """Return a copy of the given tweet with the new user and date.
+    def retweet(self, tweet: Tweet, new_date: date | None = None) -> Tweet:
+        """Record that this User retweeted <tweet> on <new_date> (today if
+        <new_date> is None), and return the new tweet.
 
         The new tweet has 0 likes, regardless of the number of likes of the
         original tweet.
 
+        The new tweet shares the original's content string rather than copying
+        it, so a retweet costs the same amount of memory however long the
+        content is. Since strings are immutable, editing either tweet gives
+        that tweet a new string and leaves the other one unchanged.
+
+        Like add_tweet, retweets must be made in date order, so <new_date>
+        must not be before the date of this User's latest tweet.
+
+        Preconditions:
+        - new_date is None or self.tweets == [] or self.tweets[-1].created_at <= new_date
+
+        >>> u = User('Diane', 'amazing laugh')
         >>> t1 = Tweet('David', date(2017, 8, 19), 'David is so cool!')
-        >>> t2 = retweet('Diane', t1, date(2017, 8, 20))
+        >>> t2 = u.retweet(t1, date(2017, 8, 20))
         >>> t2.content
         'David is so cool!'
         >>> t2.userid
         'Diane'
         >>> t2.created_at
         datetime.date(2017, 8, 20)
+        >>> t2.content is t1.content
+        True
+        >>> t2.edit('Diane is cooler')
+        >>> t1.content
+        'David is so cool!'
+        >>> u.tweets == [t2]
+        True
         """
-        return Tweet(new_user, new_date, tweet.content)
+        new_tweet = Tweet(self.userid, date.today() if new_date is None else new_date,
+                          tweet.content)
+        self.add_tweet(new_tweet)
+        return new_tweet
+
+
+def bulk_edit(users: Iterable[User], predicate: Callable[[Tweet], bool],
+              replacement: str) -> int:
+    """Replace the content of every tweet made by a user in <users> for which
+    <predicate> returns True with <replacement>. Return the number of tweets
+    that were rewritten.
+
+    Each user is only processed once, even if they appear in <users> more
+    than once. This does the same thing as calling Tweet.edit on every
+    matching tweet, but in one pass per user: each user's verbosity index is
+    updated once per year rather than once per tweet, and <replacement> is
+    only split into words once for each user's text index.
+
+    >>> u1 = User('Diane', 'amazing laugh')
+    >>> u2 = User('David', 'okay laugh')
+    >>> u1.tweet('Diane is so cool')
+    >>> u2.tweet('David is so cool')
+    >>> u2.tweet('Hello')
+    >>> bulk_edit([u1, u2, u2], lambda t: 'cool' in t.content, '[redacted]')
+    2
+    >>> [t.content for t in u2.tweets]
+    ['[redacted]', 'Hello']
+    >>> u2.verbosity(date.today().year)
+    15
+    """
+    new_length = len(replacement)
+    rewritten = 0
+    seen = set()
+    for user in users:
+        if id(user) in seen:
+            continue
+        seen.add(id(user))
+        deltas = {}
+        edits = []
+        for tweet in user.tweets:
+            if predicate(tweet):
+                year = tweet.created_at.year
+                deltas[year] = deltas.get(year, 0) + new_length - len(tweet.content)
+                edits.append((tweet, tweet.content))
+                tweet.content = replacement
+        for year, delta in deltas.items():
+            user._add_verbosity(year, delta)
+        if user.text_index is not None:
+            user.text_index.update_many(edits, replacement)
+        rewritten += len(edits)
+    return rewritten
+
+
+def _every_tweet(_: Tweet) -> bool:
+    """Return True. Used as a bulk_edit predicate that matches every tweet.
+    """
+    return True
+
+
+def _timeline_key(tweet: Tweet) -> tuple[date, str, int]:
+    """Return the key that orders tweets from different users in a timeline.
+
+    Users with the same userid are told apart by the id() of the User.
+    """
+    return tweet.created_at, tweet.userid, id(tweet._owner)
+
+
+def _start(user: User, cursor: Tweet | None) -> int:
+    """Return the number of tweets in <user>.tweets that come after <cursor>
+    in a timeline, i.e. the index of the first tweet that should not be shown.
+
+    <user>.tweets must be in date order, oldest first.
+    """
+    tweets = user.tweets
+    if cursor is None:
+        return len(tweets)
+    when = cursor.created_at
+    mine = (user.userid, id(user))
+    theirs = (cursor.userid, id(cursor._owner))
+    if mine < theirs:
+        return bisect_right(tweets, when, key=lambda t: t.created_at)
+    start = bisect_left(tweets, when, key=lambda t: t.created_at)
+    if mine == theirs:
+        i = start
+        while i < len(tweets) and tweets[i].created_at == when:
+            if tweets[i] is cursor:
+                return i
+            i += 1
+    return start
+
+
+def _newest_first(tweets: list[Tweet], stop: int) -> Iterator[Tweet]:
+    """Yield tweets[stop - 1], tweets[stop - 2], ..., tweets[0] lazily.
+    """
+    for i in range(stop - 1, -1, -1):
+        yield tweets[i]
 
 
 if __name__ == '__main__':
@@ -232,6 +528,7 @@ if __name__ == '__main__':
     # import python_ta
     #
     # python_ta.check_all(config={
-    #     'extra-imports': ['datetime'],
+    #     'extra-imports': ['bisect', 'datetime', 'heapq', 'itertools', 'os',
+    #                       'text_index', 'trending'],
     #     'max-line-length': 100
     # })
@@ -0,0 +1,259 @@
+"""CSC148 Lab 2: Saving and loading users and tweets
+
+=== CSC148 Winter 2025 ===
+Department of Computer Science,
+University of Toronto
+
+=== Module description ===
+This module saves users, who they follow and their tweets to files, and loads
+them back. Everything goes through generators of records, so only one record
+is held in memory at a time while reading or writing.
+
+A record is a dict in one of these forms:
+- {'type': 'user', 'userid': str, 'bio': str}
+- {'type': 'follow', 'follower': str, 'followee': str}
+- {'type': 'tweet', 'userid': str, 'created_at': date, 'likes': int,
+   'content': str}
+
+Two file formats are supported: line-delimited JSON (one record per line,
+with dates written as YYYY-MM-DD) and a compact binary format:
+- the 4 bytes b'TWT1', then for each record:
+- a 1-byte tag: b'U' (user), b'F' (follow) or b'T' (tweet), followed by
+  - user: userid, bio
+  - follow: follower, followee
+  - tweet: userid, then the date ordinal and likes as little-endian signed
+    32-bit and 64-bit ints, then content
+  where every string is a little-endian unsigned 32-bit byte count followed
+  by that many bytes of utf-8.
+"""
+from __future__ import annotations
+import json
+import struct
+from datetime import date
+from typing import Any, BinaryIO, Iterable, Iterator, TextIO
+
+from tweet import Tweet, User
+
+MAGIC = b'TWT1'
+_LENGTH = struct.Struct('<I')
+_TWEET_FIELDS = struct.Struct('<iq')
+
+
+def records(users: Iterable[User]) -> Iterator[dict[str, Any]]:
+    """Yield records for every user in <users>, then for every follow between
+    two of those users, then for every tweet those users made.
+
+    Each user's tweets are yielded in the order they appear in user.tweets.
+    """
+    users = list(users)
+    userids = set()
+    for user in users:
+        userids.add(user.userid)
+        yield {'type': 'user', 'userid': user.userid, 'bio': user.bio}
+    for user in users:
+        for other in user.follows:
+            if other.userid in userids:
+                yield {'type': 'follow', 'follower': user.userid,
+                       'followee': other.userid}
+    for user in users:
+        for tweet in user.tweets:
+            yield {'type': 'tweet', 'userid': tweet.userid,
+                   'created_at': tweet.created_at, 'likes': tweet.likes,
+                   'content': tweet.content}
+
+
+def load(recs: Iterable[dict[str, Any]]) -> dict[str, User]:
+    """Create the users, follows and tweets described by <recs> and return a
+    dict mapping each userid to its new User.
+
+    A user's record must come before any follow or tweet record that mentions them, and each
+    user's tweets must be in date order, oldest first. The new users have no
+    trending or text index, so loading adds nothing to any index; only the
+    returned users hold on to what was loaded.
+
+    Raise ValueError if a record is missing a field or mentions a userid with
+    no user record.
+
+    >>> u1 = User('Diane', 'amazing laugh')
+    >>> u2 = User('David', 'okay laugh')
+    >>> u1.follow(u2)
+    >>> u2.tweet('David is so cool')
+    >>> users = load(records([u1, u2]))
+    >>> [u.userid for u in users['Diane'].follows]
+    ['David']
+    >>> users['David'].tweets[0].content
+    'David is so cool'
+    >>> load([{'type': 'user', 'userid': 'David'}])
+    Traceback (most recent call last):
+    ...
+    ValueError: user record is missing field 'bio'
+    >>> load([{'type': 'follow', 'follower': 'David', 'followee': 'Diane'}])
+    Traceback (most recent call last):
+    ...
+    ValueError: no user record for 'David'
+    """
+    users = {}
+    for rec in recs:
+        kind = _field(rec, 'type')
+        if kind == 'tweet':
+            tweet = Tweet(_field(rec, 'userid'), _field(rec, 'created_at'),
+                          _field(rec, 'content'))
+            tweet.likes = _field(rec, 'likes')
+            _user(users, tweet.userid).add_tweet(tweet)
+        elif kind == 'follow':
+            follower = _user(users, _field(rec, 'follower'))
+            follower.follow(_user(users, _field(rec, 'followee')))
+        elif kind == 'user':
+            userid = _field(rec, 'userid')
+            users[userid] = User(userid, _field(rec, 'bio'))
+        else:
+            raise ValueError(f'unknown record type {kind!r}')
+    return users
+
+
+def _field(rec: dict[str, Any], name: str) -> Any:
+    """Return the field <name> of <rec>.
+
+    Raise ValueError if <rec> has no such field.
+    """
+    try:
+        return rec[name]
+    except KeyError:
+        kind = rec.get('type', 'untyped')
+        raise ValueError(f'{kind} record is missing field {name!r}') from None
+
+
+def _user(users: dict[str, User], userid: str) -> User:
+    """Return users[<userid>].
+
+    Raise ValueError if there is no such user.
+    """
+    try:
+        return users[userid]
+    except KeyError:
+        raise ValueError(f'no user record for {userid!r}') from None
+
+
+def dump_jsonl(recs: Iterable[dict[str, Any]], fp: TextIO) -> int:
+    """Write each record in <recs> to <fp> as one line of JSON. Return the
+    number of records written.
+    """
+    count = 0
+    for rec in recs:
+        if rec['type'] == 'tweet':
+            rec = dict(rec, created_at=rec['created_at'].isoformat())
+        fp.write(json.dumps(rec, ensure_ascii=False))
+        fp.write('\n')
+        count += 1
+    return count
+
+
+def iter_jsonl(fp: TextIO) -> Iterator[dict[str, Any]]:
+    """Yield the records in <fp>, a file written by dump_jsonl.
+
+    >>> import io
+    >>> buffer = io.StringIO()
+    >>> dump_jsonl([{'type': 'user', 'userid': 'David', 'bio': 'okay laugh'},
+    ...             {'type': 'tweet', 'userid': 'David', 'likes': 3,
+    ...              'created_at': date(2017, 8, 19), 'content': 'Hi'}], buffer)
+    2
+    >>> _ = buffer.seek(0)
+    >>> list(iter_jsonl(buffer))[1]['created_at']
+    datetime.date(2017, 8, 19)
+    """
+    for line in fp:
+        if line.strip():
+            rec = json.loads(line)
+            if rec['type'] == 'tweet':
+                rec['created_at'] = date.fromisoformat(rec['created_at'])
+            yield rec
+
+
+def dump_binary(recs: Iterable[dict[str, Any]], fp: BinaryIO) -> int:
+    """Write the records in <recs> to <fp> in the binary format described at
+    the top of this module. Return the number of records written.
+    """
+    fp.write(MAGIC)
+    count = 0
+    for rec in recs:
+        kind = rec['type']
+        if kind == 'tweet':
+            fp.write(b'T' + _pack_str(rec['userid'])
+                     + _TWEET_FIELDS.pack(rec['created_at'].toordinal(), rec['likes'])
+                     + _pack_str(rec['content']))
+        elif kind == 'follow':
+            fp.write(b'F' + _pack_str(rec['follower']) + _pack_str(rec['followee']))
+        elif kind == 'user':
+            fp.write(b'U' + _pack_str(rec['userid']) + _pack_str(rec['bio']))
+        else:
+            raise ValueError(f'unknown record type {kind!r}')
+        count += 1
+    return count
+
+
+def iter_binary(fp: BinaryIO) -> Iterator[dict[str, Any]]:
+    """Yield the records in <fp>, a file written by dump_binary.
+
+    Raise ValueError if <fp> is not in the binary format.
+
+    >>> import io
+    >>> buffer = io.BytesIO()
+    >>> dump_binary([{'type': 'user', 'userid': 'David', 'bio': 'okay laugh'},
+    ...              {'type': 'tweet', 'userid': 'David', 'likes': 3,
+    ...               'created_at': date(2017, 8, 19), 'content': 'Hi'}], buffer)
+    2
+    >>> _ = buffer.seek(0)
+    >>> list(iter_binary(buffer))[1]
+    {'type': 'tweet', 'userid': 'David', 'created_at': datetime.date(2017, 8, 19), \
+'likes': 3, 'content': 'Hi'}
+    """
+    if fp.read(len(MAGIC)) != MAGIC:
+        raise ValueError('not a binary tweet file')
+    while True:
+        tag = fp.read(1)
+        if tag == b'T':
+            userid = _read_str(fp)
+            ordinal, likes = _TWEET_FIELDS.unpack(_read_exactly(fp, _TWEET_FIELDS.size))
+            yield {'type': 'tweet', 'userid': userid,
+                   'created_at': date.fromordinal(ordinal), 'likes': likes,
+                   'content': _read_str(fp)}
+        elif tag == b'F':
+            yield {'type': 'follow', 'follower': _read_str(fp),
+                   'followee': _read_str(fp)}
+        elif tag == b'U':
+            yield {'type': 'user', 'userid': _read_str(fp), 'bio': _read_str(fp)}
+        elif tag == b'':
+            return
+        else:
+            raise ValueError(f'unknown record tag {tag!r}')
+
+
+def _pack_str(s: str) -> bytes:
+    """Return <s> encoded as a length-prefixed utf-8 string.
+    """
+    encoded = s.encode()
+    return _LENGTH.pack(len(encoded)) + encoded
+
+
+def _read_str(fp: BinaryIO) -> str:
+    """Read and return one length-prefixed utf-8 string from <fp>.
+    """
+    length, = _LENGTH.unpack(_read_exactly(fp, _LENGTH.size))
+    return _read_exactly(fp, length).decode()
+
+
+def _read_exactly(fp: BinaryIO, n: int) -> bytes:
+    """Read and return exactly <n> bytes from <fp>.
+
+    Raise ValueError if <fp> ends first.
+    """
+    data = fp.read(n)
+    if len(data) != n:
+        raise ValueError('binary tweet file ends in the middle of a record')
+    return data
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
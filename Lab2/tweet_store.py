@@ -0,0 +1,245 @@
+"""CSC148 Lab 2: Columnar tweet storage
+
+=== CSC148 Winter 2025 ===
+Department of Computer Science,
+University of Toronto
+
+=== Module description ===
+This module contains TweetStore, a compact alternative to keeping a
+list[Tweet]. Instead of one Python object per tweet, every field is kept in
+its own column: likes, dates and authors in int arrays, and every tweet's
+content in one shared utf-8 buffer addressed by offsets.
+
+TweetView gives a lightweight handle on one row of a store that behaves like
+a Tweet (attribute access, like and edit).
+"""
+from __future__ import annotations
+from array import array
+from datetime import date
+from typing import Iterator
+
+
+class TweetStore:
+    """A columnar collection of tweets.
+
+    Tweet i of this store is made up of row i of every column below.
+
+    Private Attributes:
+    - _userids: the distinct userids of the tweets in this store.
+    - _userid_index: maps each userid to its position in _userids.
+    - _authors: _authors[i] is the position in _userids of tweet i's author.
+    - _dates: _dates[i] is the ordinal (see date.toordinal) of tweet i's date.
+    - _likes: _likes[i] is the number of likes tweet i has received.
+    - _offsets: _offsets[i] is where tweet i's content starts in _buffer.
+    - _lengths: _lengths[i] is the number of bytes of tweet i's content.
+    - _buffer: the utf-8 encoded contents of every tweet, back to back.
+    - _garbage: the number of bytes in _buffer no longer used by any tweet.
+
+    Representation Invariants:
+    - len(self._authors) == len(self._dates) == len(self._likes)
+    - len(self._likes) == len(self._offsets) == len(self._lengths)
+    - 0 <= self._garbage <= len(self._buffer)
+
+    Sample Usage:
+
+    >>> store = TweetStore()
+    >>> t = store.add('Rukhsana', date(2017, 9, 16), 'Hey!')
+    >>> t.userid
+    'Rukhsana'
+    >>> t.created_at
+    datetime.date(2017, 9, 16)
+    >>> t.content
+    'Hey!'
+    >>> t.like(3)
+    >>> t.likes
+    3
+    >>> t.edit('Rukhsana is cool')
+    >>> store[0].content
+    'Rukhsana is cool'
+    >>> len(store)
+    1
+    """
+    _userids: list[str]
+    _userid_index: dict[str, int]
+    _authors: array
+    _dates: array
+    _likes: array
+    _offsets: array
+    _lengths: array
+    _buffer: bytearray
+    _garbage: int
+
+    def __init__(self) -> None:
+        """Initialize a new empty TweetStore.
+        """
+        self._userids = []
+        self._userid_index = {}
+        self._authors = array('i')
+        self._dates = array('i')
+        self._likes = array('i')
+        self._offsets = array('q')
+        self._lengths = array('i')
+        self._buffer = bytearray()
+        self._garbage = 0
+
+    def __len__(self) -> int:
+        """Return the number of tweets in this store.
+        """
+        return len(self._likes)
+
+    def __getitem__(self, i: int) -> TweetView:
+        """Return a view of tweet <i> of this store.
+
+        Raise IndexError if there is no such tweet.
+        """
+        if not -len(self) <= i < len(self):
+            raise IndexError
+        return TweetView(self, i % len(self))
+
+    def __iter__(self) -> Iterator[TweetView]:
+        """Return an iterator over views of every tweet in this store.
+        """
+        for i in range(len(self)):
+            yield TweetView(self, i)
+
+    def add(self, who: str, when: date, what: str) -> TweetView:
+        """Add a new tweet with 0 likes to this store and return a view of it.
+
+        >>> store = TweetStore()
+        >>> store.add('David', date(2017, 8, 19), 'David is so cool!').content
+        'David is so cool!'
+        """
+        if who not in self._userid_index:
+            self._userid_index[who] = len(self._userids)
+            self._userids.append(who)
+        encoded = what.encode()
+        self._authors.append(self._userid_index[who])
+        self._dates.append(when.toordinal())
+        self._likes.append(0)
+        self._offsets.append(len(self._buffer))
+        self._lengths.append(len(encoded))
+        self._buffer += encoded
+        return TweetView(self, len(self._likes) - 1)
+
+    def content(self, i: int) -> str:
+        """Return the content of tweet <i>.
+        """
+        start = self._offsets[i]
+        return self._buffer[start:start + self._lengths[i]].decode()
+
+    def userid(self, i: int) -> str:
+        """Return the userid of the author of tweet <i>.
+        """
+        return self._userids[self._authors[i]]
+
+    def created_at(self, i: int) -> date:
+        """Return the date tweet <i> was written.
+        """
+        return date.fromordinal(self._dates[i])
+
+    def likes(self, i: int) -> int:
+        """Return the number of likes tweet <i> has received.
+        """
+        return self._likes[i]
+
+    def like(self, i: int, n: int) -> None:
+        """Record that tweet <i> received <n> more likes.
+        """
+        self._likes[i] += n
+
+    def edit(self, i: int, new_content: str) -> None:
+        """Replace the content of tweet <i> with <new_content>.
+
+        The new content is written to the end of the shared buffer; the space
+        used by the old content is reclaimed once at least half of the buffer
+        is unused.
+
+        >>> store = TweetStore()
+        >>> _ = store.add('Diane', date(2017, 8, 20), 'okay laugh')
+        >>> _ = store.add('David', date(2017, 8, 20), 'David is so cool')
+        >>> store.edit(0, 'mwahahaha')
+        >>> [t.content for t in store]
+        ['mwahahaha', 'David is so cool']
+        """
+        encoded = new_content.encode()
+        self._garbage += self._lengths[i]
+        self._offsets[i] = len(self._buffer)
+        self._lengths[i] = len(encoded)
+        self._buffer += encoded
+        if self._garbage * 2 > len(self._buffer):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Rewrite the shared buffer so that it only holds live contents.
+        """
+        buffer = bytearray()
+        for i in range(len(self._offsets)):
+            start = self._offsets[i]
+            self._offsets[i] = len(buffer)
+            buffer += self._buffer[start:start + self._lengths[i]]
+        self._buffer = buffer
+        self._garbage = 0
+
+
+class TweetView:
+    """A lightweight handle on one tweet in a TweetStore.
+
+    A TweetView has the same attributes and methods as Tweet, but keeps no
+    data of its own: every read and write goes to its store.
+
+    Private Attributes:
+    - _store: the store that holds this tweet.
+    - _index: the position of this tweet in _store.
+    """
+    __slots__ = ('_store', '_index')
+    _store: TweetStore
+    _index: int
+
+    def __init__(self, store: TweetStore, index: int) -> None:
+        """Initialize a view of tweet <index> in <store>.
+        """
+        self._store = store
+        self._index = index
+
+    def __repr__(self) -> str:
+        """Return a string representation of this tweet.
+        """
+        return f'TweetView({self.userid!r}, {self.created_at!r}, {self.content!r})'
+
+    @property
+    def content(self) -> str:
+        """The contents of the tweet."""
+        return self._store.content(self._index)
+
+    @property
+    def userid(self) -> str:
+        """The id of the user who wrote the tweet."""
+        return self._store.userid(self._index)
+
+    @property
+    def created_at(self) -> date:
+        """The date the tweet was written."""
+        return self._store.created_at(self._index)
+
+    @property
+    def likes(self) -> int:
+        """The number of likes this tweet has received."""
+        return self._store.likes(self._index)
+
+    def like(self, n: int) -> None:
+        """Record the fact that this tweet received <n> likes.
+
+        These likes are in addition to the ones <self> already has.
+        """
+        self._store.like(self._index, n)
+
+    def edit(self, new_content: str) -> None:
+        """Replace the contents of this tweet with the new message.
+        """
+        self._store.edit(self._index, new_content)
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,127 @@
+"""CSC148 Lab 3: Benchmarks
+
+=== CSC148 Winter 2025 ===
+Department of Computer Science,
+University of Toronto
+
+=== Module Description ===
+This module contains benchmarks for the number game and the modules built on
+top of it. Run it directly to print the results of every benchmark.
+"""
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+
+# Contract checking would dominate every measurement below.
+os.environ['CHECK_CONTRACTS'] = '0'
+
+from lab3 import OptimalPlayer, RandomPlayer, StrategicPlayer
+from monte_carlo import estimate_win_rate
+from server import play_remote, start_server
+from simulation import simulate
+from solver import move_table
+from tournament import run_tournament, write_table
+
+
+def bench_simulate(n: int = 100_000, goal: int = 21, min_step: int = 1,
+                   max_step: int = 3) -> None:
+    """Print the number of headless games of RandomPlayer against RandomPlayer
+    that simulate plays per second.
+    """
+    result = simulate((RandomPlayer('r1'), RandomPlayer('r2')), n, goal, min_step, max_step)
+    print(f'simulate: {result.games_per_second():8.0f} games/s '
+          f'({result.turns / result.games:.1f} turns/game), {result}')
+
+
+def bench_monte_carlo(n: int = 10_000_000, goal: int = 21, min_step: int = 1,
+                      max_step: int = 3) -> None:
+    """Print the number of games of OptimalPlayer against RandomPlayer that
+    estimate_win_rate plays per second, compared with simulate.
+    """
+    start = time.perf_counter()
+    estimate = estimate_win_rate(OptimalPlayer('o'), n, goal, min_step, max_step, seed=148)
+    vectorized = n / (time.perf_counter() - start)
+    result = simulate((OptimalPlayer('o'), RandomPlayer('r')), n // 100, goal, min_step,
+                      max_step)
+    print(f'estimate_win_rate: {vectorized:10.0f} games/s, {estimate}')
+    print(f'simulate:          {result.games_per_second():10.0f} games/s '
+          f'({vectorized / result.games_per_second():.0f}x slower)')
+
+
+def bench_solver(goal: int = 1_000_000, min_step: int = 3, max_step: int = 17,
+                 n: int = 1_000_000) -> None:
+    """Print how long move_table takes to solve a game with a large <goal>,
+    how long a cached lookup of the same table takes, and how many moves per
+    second OptimalPlayer and StrategicPlayer make (at goal 21, the only one
+    StrategicPlayer handles).
+    """
+    move_table.cache_clear()
+    start = time.perf_counter()
+    move_table(goal, min_step, max_step)
+    solved = time.perf_counter() - start
+    start = time.perf_counter()
+    move_table(goal, min_step, max_step)
+    cached = time.perf_counter() - start
+    print(f'move_table({goal}, {min_step}, {max_step}): {solved * 1e3:.0f} ms to solve, '
+          f'{cached * 1e6:.1f} us when cached')
+
+    for player in (OptimalPlayer('o'), StrategicPlayer('s')):
+        start = time.perf_counter()
+        for i in range(n):
+            player.move(i % 21, 1, 3, 21)
+        elapsed = time.perf_counter() - start
+        print(f'{type(player).__name__}.move: {n / elapsed / 1e6:.2f}M moves/s')
+
+
+def bench_server(sessions: tuple[int, ...] = (100, 1_000, 5_000)) -> None:
+    """Print the move latency percentiles of a local game server when each
+    number of <sessions> random players play one game at the same time.
+    """
+    def choose(current: int, min_step: int, max_step: int, goal: int) -> int:
+        return random.randint(min_step, max_step)
+
+    async def load_test(n: int) -> tuple[list[float], float]:
+        server = await start_server(21, 1, 3)
+        async with server:
+            port = server.sockets[0].getsockname()[1]
+            start = time.perf_counter()
+            results = await asyncio.gather(*(play_remote('127.0.0.1', port, choose)
+                                             for _ in range(n)))
+            elapsed = time.perf_counter() - start
+        return [latency for _, latencies in results for latency in latencies], elapsed
+
+    for n in sessions:
+        latencies, elapsed = asyncio.run(load_test(n))
+        cuts = statistics.quantiles(latencies, n=100)
+        print(f'{n:>5} sessions: {len(latencies) / elapsed:6.0f} moves/s, latency '
+              f'p50 {cuts[49] * 1e3:6.1f} ms, p95 {cuts[94] * 1e3:6.1f} ms, '
+              f'p99 {cuts[98] * 1e3:6.1f} ms')
+
+
+def bench_tournament(workers: tuple[int, ...] = (1, 2, 4, 8), games: int = 100_000) -> None:
+    """Print how long run_tournament takes with each number of <workers>, and
+    the results table of the last run.
+    """
+    configs = [(21, 1, 3), (30, 1, 3), (50, 2, 5)]
+    for n_workers in workers:
+        start = time.perf_counter()
+        rows = run_tournament([RandomPlayer, OptimalPlayer], configs, games,
+                              seed=148, workers=n_workers)
+        elapsed = time.perf_counter() - start
+        print(f'{n_workers} workers: {len(configs) * games / elapsed:8.0f} games/s')
+    path = os.path.join(tempfile.gettempdir(), 'tournament_results.csv')
+    write_table(rows, path)
+    print(f'results table written to {path}:')
+    with open(path) as f:
+        print(f.read(), end='')
+
+
+if __name__ == '__main__':
+    bench_simulate()
+    bench_monte_carlo()
+    bench_solver()
+    bench_server()
+    bench_tournament()
@@ -10,9 +10,32 @@ The key class design feature here is *inheritance*, which is used to enable
 different types of players, both human and computer, for the game.
 """
 from __future__ import annotations
+import os
 import random
+from typing import Any, Callable
 
-from python_ta.contracts import check_contracts
+from solver import move_table
+
+
+def _no_contracts(obj: Any) -> Any:
+    """Return <obj> unchanged, without adding any contract checks."""
+    return obj
+
+
+# Set the CHECK_CONTRACTS environment variable to 0 to skip contract checking
+# (and importing python_ta) when speed matters.
+check_contracts = _no_contracts
+if os.environ.get('CHECK_CONTRACTS', '1') != '0':
+    from python_ta.contracts import check_contracts
+
+
+def print_move(player: Player, amount: int, total: int) -> None:
+    """Print that <player> moved <amount>, bringing the total to <total>.
+
+    This is how NumberGame reports moves by default.
+    """
+    print(f'{player.name} moves {amount}.')
+    print(f'Total is now {total}.')
 
 
 ################################################################################
@@ -50,6 +73,9 @@ class NumberGame:
         The turn the game is on, beginning with turn 0.
         If turn is even number, it is players[0]'s turn.
         If turn is any odd number, it is player[1]'s turn.
+    - log:
+        Called with the player, their move and the new total after every
+        turn, or None if moves are not reported at all.
 
     Representation Invariants:
     - self.turn >= 0
@@ -62,11 +88,16 @@ class NumberGame:
     current: int
     players: tuple[Player, Player]
     turn: int
+    log: Callable[[Player, int, int], None] | None
 
     def __init__(self, goal: int, min_step: int, max_step: int,
-                 players: tuple[Player, Player]) -> None:
+                 players: tuple[Player, Player],
+                 log: Callable[[Player, int, int], None] | None = print_move) -> None:
         """Initialize this NumberGame.
 
+        Moves are reported by calling <log>; by default they are printed.
+        Pass None to report nothing, e.g. when simulating many games.
+
         Preconditions:
         - 0 < min_step <= max_step <= goal
         """
@@ -76,6 +107,7 @@ class NumberGame:
         self.current = 0
         self.players = players
         self.turn = 0
+        self.log = log
 
     def play(self) -> str:
         """Play one round of this NumberGame. Return the name of the winner.
@@ -106,7 +138,7 @@ class NumberGame:
 
         Determine whose move it is, get their move, and update the current
         total as well as the number of the turn we are on.
-        Print the move and the new total.
+        Report the move and the new total to self.log.
         """
         next_player = self.whose_turn(self.turn)
         amount = next_player.move(
@@ -124,8 +156,8 @@ class NumberGame:
 
         self.turn += 1
 
-        print(f'{next_player.name} moves {amount}.')
-        print(f'Total is now {self.current}.')
+        if self.log is not None:
+            self.log(next_player, amount, self.current)
 
 
 ################################################################################
@@ -208,6 +240,26 @@ class StrategicPlayer(Player):
         num = goal-cur_count
         return num
 
+
+class OptimalPlayer(Player):
+    """
+    The optimal player makes a winning move whenever there is one, for any
+    goal, min_step and max_step
+    """
+    def move(self, cur_count: int, min_step: int, max_step: int, goal: int) -> int:
+        """
+        Looks up the best move in the move table for this game's settings
+
+        >>> p = OptimalPlayer('Olivia')
+        >>> p.move(0, 1, 3, 21)
+        1
+        >>> p.move(11, 1, 3, 21)
+        2
+        >>> p.move(0, 2, 3, 10)
+        2
+        """
+        return move_table(goal, min_step, max_step)[cur_count]
+
 @check_contracts
 def make_player(generic_name: str) -> Player:
     """Return a new Player based on user input.
@@ -257,12 +309,12 @@ if __name__ == '__main__':
     # Uncomment to check your work with python_ta!
     import python_ta
     python_ta.check_all(config={
-        'extra-imports': ['random'],
+        'extra-imports': ['os', 'random', 'solver'],
         'allowed-io': [
             'main',
             'make_player',
             'UserPlayer.move',
-            'NumberGame.play_one_turn'
+            'print_move'
         ],
         'max-line-length': 100
     })
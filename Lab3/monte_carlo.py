@@ -0,0 +1,174 @@
+"""CSC148 Lab 3: Monte Carlo estimates of win rates against RandomPlayer
+
+=== CSC148 Winter 2025 ===
+Department of Computer Science,
+University of Toronto
+
+=== Module Description ===
+This module estimates how often a strategy beats RandomPlayer in a NumberGame
+by playing many games at once with NumPy instead of one NumberGame at a time.
+
+Every game is a slot in an array of counts. On each turn, the games that are
+still going all move together: RandomPlayer's moves are drawn in bulk, and
+the other player's moves are looked up in a table that holds their move from
+every count. So the other player's move must only depend on the count, as
+it does for OptimalPlayer. A RandomPlayer can also be
+the other player, in which case both players' moves are drawn at random.
+"""
+from __future__ import annotations
+import math
+from statistics import NormalDist
+
+import numpy as np
+
+from lab3 import Player, RandomPlayer
+
+
+class WinRateEstimate:
+    """An estimate of how often a player wins, from a sample of games.
+
+    Attributes:
+    - name: the name of the player.
+    - games: the number of games played.
+    - wins: the number of those games the player won.
+    - confidence: the confidence level of the interval, e.g. 0.95.
+    - low: the lower end of the confidence interval for the win rate.
+    - high: the upper end of the confidence interval for the win rate.
+
+    Representation Invariants:
+    - 0 <= self.wins <= self.games
+    - 0 <= self.low <= self.high <= 1
+    """
+    name: str
+    games: int
+    wins: int
+    confidence: float
+    low: float
+    high: float
+
+    def __init__(self, name: str, games: int, wins: int, confidence: float) -> None:
+        """Initialize the estimate for a player called <name> who won <wins>
+        of <games> games, with a Wilson score interval at <confidence>.
+        """
+        self.name = name
+        self.games = games
+        self.wins = wins
+        self.confidence = confidence
+        self.low, self.high = wilson_interval(wins, games, confidence)
+
+    def __repr__(self) -> str:
+        """Return a one-line summary of this estimate.
+        """
+        return (f'{self.name} wins {self.rate():.4f} '
+                f'({self.confidence:.0%} CI {self.low:.4f}-{self.high:.4f}, '
+                f'{self.games} games)')
+
+    def rate(self) -> float:
+        """Return the fraction of games won.
+        """
+        return self.wins / self.games if self.games else 0.0
+
+
+def wilson_interval(wins: int, games: int, confidence: float) -> tuple[float, float]:
+    """Return the Wilson score interval at <confidence> for a win rate,
+    given <wins> wins in <games> games.
+
+    Preconditions:
+    - 0 <= wins <= games
+    - 0 < confidence < 1
+
+    >>> low, high = wilson_interval(50, 100, 0.95)
+    >>> round(low, 3), round(high, 3)
+    (0.404, 0.596)
+    """
+    if games == 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    p = wins / games
+    centre = p + z * z / (2 * games)
+    spread = z * math.sqrt(p * (1 - p) / games + z * z / (4 * games * games))
+    scale = 1 + z * z / games
+    return max(0.0, (centre - spread) / scale), min(1.0, (centre + spread) / scale)
+
+
+def estimate_win_rate(player: Player, n: int, goal: int, min_step: int, max_step: int,
+                      seed: int | None = None, confidence: float = 0.95,
+                      batch_size: int = 50_000) -> WinRateEstimate:
+    """Play <n> games of <player> against a RandomPlayer and return an
+    estimate of how often <player> wins.
+
+    The players take turns moving first, with <player> moving first in the
+    first game. The random moves come from a NumPy generator seeded with
+    <seed>, so the same seed gives the same estimate. At most <batch_size>
+    games are played at once, to bound the memory used.
+
+    Raise ValueError if <player> would make an illegal move.
+
+    Preconditions:
+    - n >= 0
+    - 0 < min_step <= max_step <= goal
+    - 0 < confidence < 1
+    - batch_size > 0
+    - <player> is a RandomPlayer or its move only depends on the count
+
+    >>> from lab3 import OptimalPlayer, StrategicPlayer
+    >>> estimate_win_rate(OptimalPlayer('o'), 10_000, 21, 1, 3, seed=148)
+    o wins 0.9992 (95% CI 0.9984-0.9996, 10000 games)
+    >>> estimate_win_rate(OptimalPlayer('o'), 100, 100_000, 1, 40_000, seed=148).wins
+    100
+    >>> estimate_win_rate(StrategicPlayer('s'), 10, 21, 1, 3)
+    Traceback (most recent call last):
+    ...
+    ValueError: s moves 0 from 1, which is not between 1 and 3
+    """
+    table = None
+    if not isinstance(player, RandomPlayer):
+        table = np.array([player.move(count, min_step, max_step, goal)
+                          for count in range(goal)], dtype=np.int64)
+        illegal = np.flatnonzero((table < min_step) | (table > max_step))
+        if len(illegal) > 0:
+            count = int(illegal[0])
+            raise ValueError(f'{player.name} moves {table[count]} from {count}, '
+                             f'which is not between {min_step} and {max_step}')
+
+    rng = np.random.default_rng(seed)
+    wins = 0
+    for start in range(0, n, batch_size):
+        games = min(batch_size, n - start)
+        # The player moves first in the even-numbered games overall.
+        player_first = (start + np.arange(games)) % 2 == 0
+        wins += _play_batch(table, player_first, goal, min_step, max_step, rng)
+    return WinRateEstimate(player.name, n, wins, confidence)
+
+
+def _play_batch(table: np.ndarray | None, player_first: np.ndarray, goal: int,
+                min_step: int, max_step: int, rng: np.random.Generator) -> int:
+    """Play one game for each item of <player_first>, which says whether the
+    player moves first in that game, and return how many the player won.
+
+    The player's move from each count is in <table>, or is random if <table>
+    is None.
+    """
+    current = np.zeros(len(player_first), dtype=np.intp)
+    # Whether it is the player's turn in each game still going. Finished games
+    # are dropped from both arrays at the end of every turn.
+    player_turn = player_first
+    wins = 0
+    while len(current) > 0:
+        moves = rng.integers(min_step, max_step, endpoint=True, size=len(current),
+                             dtype=np.intp)
+        if table is not None:
+            moves = np.where(player_turn, table.take(current), moves)
+        current += moves
+        over = current >= goal
+        wins += int(np.count_nonzero(player_turn & over))
+        going = ~over
+        current = current[going]
+        player_turn = ~player_turn[going]
+    return wins
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
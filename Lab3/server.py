@@ -0,0 +1,190 @@
+"""CSC148 Lab 3: Number game server
+
+=== CSC148 Winter 2025 ===
+Department of Computer Science,
+University of Toronto
+
+=== Module Description ===
+This module hosts NumberGames over TCP with asyncio, so one process can run
+thousands of games with people at the same time. Each connection is one game
+between the person connected (a RemotePlayer, who moves first) and a computer
+player.
+
+Everything is sent as lines of ASCII text. The server sends:
+- 'turn <current> <min_step> <max_step> <goal>' when it is the person's turn;
+  they reply with a line holding just their move.
+- 'error <message>' if the reply was not a legal move, followed by another
+  'turn' line. A reply longer than the stream's line limit (64 KiB by
+  default) closes the connection instead.
+- 'move <name> <amount> <total>' after every move, by either player.
+- 'winner <name>' at the end of the game, after which it closes the
+  connection.
+
+While the server waits for someone's move, the event loop runs the other
+games. Computer players' moves are made directly, so they must be quick (like
+OptimalPlayer's table lookups) to avoid holding up the other games.
+"""
+from __future__ import annotations
+import asyncio
+import time
+from typing import Callable
+
+from lab3 import NumberGame, OptimalPlayer, Player, UserPlayer
+
+
+class RemotePlayer(UserPlayer):
+    """A user player whose moves arrive over a network connection.
+
+    Attributes:
+    - reader: the stream the player's moves are read from.
+    - writer: the stream the game is reported to.
+
+    Private Attributes:
+    - _next_move: the move received by receive_move that move will return,
+      or None if there is none.
+    """
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+    _next_move: int | None
+
+    def __init__(self, name: str, reader: asyncio.StreamReader,
+                 writer: asyncio.StreamWriter) -> None:
+        super().__init__(name)
+        self.reader = reader
+        self.writer = writer
+        self._next_move = None
+
+    async def receive_move(self, cur_count: int, min_step: int, max_step: int,
+                           goal: int) -> None:
+        """
+        Asks the player for a move until they send a legal one, and keeps it
+        for the next call to move
+
+        Raises ConnectionError if the connection closes first, or if the
+        player sends a line longer than the reader's limit.
+        """
+        while True:
+            self.writer.write(f'turn {cur_count} {min_step} {max_step} {goal}\n'.encode())
+            await self.writer.drain()
+            try:
+                line = await self.reader.readline()
+            except ValueError as error:
+                # readline raises ValueError when the line is over the limit.
+                raise ConnectionError(f'{self.name} sent too long a line') from error
+            if not line:
+                raise ConnectionError(f'{self.name} disconnected')
+            text = line.decode(errors='replace').strip()
+            # isdigit alone accepts digits such as '²' that int rejects.
+            if text.isascii() and text.isdigit() and min_step <= int(text) <= max_step:
+                self._next_move = int(text)
+                return
+            self.writer.write(f'error enter a number from {min_step} to {max_step}\n'.encode())
+
+    def move(self, cur_count: int, min_step: int, max_step: int, goal: int) -> int:
+        """
+        Returns the move received by the last call to receive_move
+
+        Preconditions:
+        receive_move has been awaited since the last call to move
+        """
+        amount = self._next_move
+        self._next_move = None
+        return amount
+
+
+async def play_session(reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                       goal: int, min_step: int, max_step: int,
+                       opponent: type[Player] = OptimalPlayer) -> str:
+    """Play one NumberGame between a RemotePlayer on <reader> and <writer>
+    and a new <opponent> called 'computer'. Return the winner's name.
+
+    Raise ConnectionError if the person disconnects before the game ends.
+
+    Preconditions:
+    - 0 < min_step <= max_step <= goal
+    """
+    remote = RemotePlayer('you', reader, writer)
+
+    def send_move(player: Player, amount: int, total: int) -> None:
+        writer.write(f'move {player.name} {amount} {total}\n'.encode())
+
+    game = NumberGame(goal, min_step, max_step, (remote, opponent('computer')), send_move)
+    while game.current < game.goal:
+        player = game.whose_turn(game.turn)
+        if player is remote:
+            await remote.receive_move(game.current, min_step, max_step, goal)
+        game.play_one_turn()
+    # The game is over, so play only records the result.
+    winner = game.play()
+    writer.write(f'winner {winner}\n'.encode())
+    await writer.drain()
+    return winner
+
+
+async def start_server(goal: int, min_step: int, max_step: int,
+                       opponent: type[Player] = OptimalPlayer, host: str = '127.0.0.1',
+                       port: int = 0) -> asyncio.Server:
+    """Start serving games with the given settings against <opponent> on
+    <host> and <port> (any free port if 0), and return the server.
+
+    Preconditions:
+    - 0 < min_step <= max_step <= goal
+    """
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            await play_session(reader, writer, goal, min_step, max_step, opponent)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port, backlog=4096)
+
+
+async def play_remote(host: str, port: int,
+                      choose: Callable[[int, int, int, int], int]
+                      ) -> tuple[str, list[float]]:
+    """Connect to the server at <host> and <port>, play one game by calling
+    <choose> with (current, min_step, max_step, goal) for every move, and
+    return the winner's name and the latency of each move.
+
+    A move's latency is the time from sending it to receiving the next 'turn'
+    or 'winner' line, which includes the computer player's reply.
+
+    >>> async def demo():
+    ...     server = await start_server(21, 1, 3)
+    ...     async with server:
+    ...         port = server.sockets[0].getsockname()[1]
+    ...         return await play_remote('127.0.0.1', port, lambda cur, lo, hi, goal: lo)
+    >>> winner, latencies = asyncio.run(demo())
+    >>> winner
+    'computer'
+    >>> len(latencies)
+    6
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    latencies = []
+    sent = None
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                raise ConnectionError('server disconnected')
+            fields = line.decode().split()
+            if fields[0] not in ('turn', 'winner'):
+                continue
+            if sent is not None:
+                latencies.append(time.perf_counter() - sent)
+            if fields[0] == 'winner':
+                return fields[1], latencies
+            amount = choose(*(int(field) for field in fields[1:]))
+            writer.write(f'{amount}\n'.encode())
+            sent = time.perf_counter()
+    finally:
+        writer.close()
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
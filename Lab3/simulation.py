@@ -0,0 +1,110 @@
+"""CSC148 Lab 3: Simulating many number games
+
+=== CSC148 Winter 2025 ===
+Department of Computer Science,
+University of Toronto
+
+=== Module Description ===
+This module plays many rounds of NumberGame between two computer players
+without printing or asking for input, and reports how each player did. It is
+meant for comparing strategies, so it should be run with the CHECK_CONTRACTS
+environment variable set to 0 when speed matters.
+"""
+from __future__ import annotations
+import time
+from typing import Callable
+
+from lab3 import NumberGame, Player
+
+
+class SimulationResult:
+    """The outcome of a batch of simulated games between two players.
+
+    Attributes:
+    - names: the names of the two players.
+    - games: the number of games played.
+    - wins: wins[i] is the number of games won by player i.
+    - first_mover_wins: the number of games won by whoever moved first.
+    - turns: the total number of turns over all games.
+    - seconds: the time taken to play every game.
+
+    Representation Invariants:
+    - self.games == self.wins[0] + self.wins[1]
+    - 0 <= self.first_mover_wins <= self.games
+    """
+    names: tuple[str, str]
+    games: int
+    wins: list[int]
+    first_mover_wins: int
+    turns: int
+    seconds: float
+
+    def __init__(self, names: tuple[str, str]) -> None:
+        """Initialize an empty result for games between players named <names>.
+        """
+        self.names = names
+        self.games = 0
+        self.wins = [0, 0]
+        self.first_mover_wins = 0
+        self.turns = 0
+        self.seconds = 0.0
+
+    def __repr__(self) -> str:
+        """Return a one-line summary of this result.
+        """
+        return (f'{self.names[0]} {self.wins[0]} - {self.wins[1]} {self.names[1]} '
+                f'({self.games} games)')
+
+    def win_rate(self, i: int) -> float:
+        """Return the fraction of games won by player <i>.
+        """
+        return self.wins[i] / self.games if self.games else 0.0
+
+    def games_per_second(self) -> float:
+        """Return the number of games played per second.
+        """
+        return self.games / self.seconds if self.seconds else 0.0
+
+
+def simulate(players: tuple[Player, Player], n: int, goal: int, min_step: int,
+             max_step: int, alternate: bool = True,
+             log: Callable[[Player, int, int], None] | None = None) -> SimulationResult:
+    """Play <n> rounds of NumberGame between <players> and return how they did.
+
+    players[0] moves first in the first game. If <alternate> is True, the
+    first mover switches every game. Every move is passed to <log>, if given.
+    Each player's wins and losses are also recorded as usual.
+
+    Preconditions:
+    - n >= 0
+    - 0 < min_step <= max_step <= goal
+    - players[0].name != players[1].name
+
+    >>> from lab3 import RandomPlayer
+    >>> result = simulate((RandomPlayer('r1'), RandomPlayer('r2')), 10, 1, 1, 1)
+    >>> result
+    r1 5 - 5 r2 (10 games)
+    >>> result.first_mover_wins
+    10
+    """
+    result = SimulationResult((players[0].name, players[1].name))
+    order = players
+    start = time.perf_counter()
+    for _ in range(n):
+        game = NumberGame(goal, min_step, max_step, order, log)
+        winner = game.play()
+        result.wins[0 if winner == players[0].name else 1] += 1
+        if winner == order[0].name:
+            result.first_mover_wins += 1
+        result.turns += game.turn
+        if alternate:
+            order = (order[1], order[0])
+    result.seconds = time.perf_counter() - start
+    result.games = n
+    return result
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,96 @@
+"""CSC148 Lab 3: Solving the number game
+
+=== CSC148 Winter 2025 ===
+Department of Computer Science,
+University of Toronto
+
+=== Module Description ===
+This module works out the best move from every position of a NumberGame with
+any goal, min_step and max_step, using dynamic programming.
+
+A position is the current count. It is *losing* if the player about to move
+loses against a perfect opponent whatever they do, and *winning* otherwise.
+Any move that brings the count to the goal or past it wins at once (NumberGame
+caps the count at the goal), and otherwise a position is winning exactly when
+some legal move leads to a losing position. Working down from the goal, and
+remembering the nearest losing position above each count, decides every
+position in O(goal) time.
+
+The move tables of the most recently used game configurations are cached, so
+players can look up their move in O(1) time on every turn.
+"""
+from __future__ import annotations
+from functools import lru_cache
+
+# The number of (goal, min_step, max_step) configurations whose move tables
+# are kept by move_table. The least recently used one is dropped first.
+CACHE_SIZE = 128
+
+
+def losing_positions(goal: int, min_step: int, max_step: int) -> list[int]:
+    """Return the counts below <goal> from which the player about to move
+    loses against a perfect opponent, in increasing order.
+
+    Preconditions:
+    - 0 < min_step <= max_step <= goal
+
+    >>> losing_positions(21, 1, 3)
+    [1, 5, 9, 13, 17]
+    >>> losing_positions(10, 2, 3)
+    [0, 1, 5, 6]
+    """
+    next_losing = _next_losing(goal, min_step, max_step)
+    return [count for count in range(goal) if next_losing[count] == count]
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def move_table(goal: int, min_step: int, max_step: int) -> tuple[int, ...]:
+    """Return a tuple whose item at index <count> is the best move when the
+    count is <count>, for every count below <goal>.
+
+    From a winning position the move always wins against any opponent. From a
+    losing position no move does, so the move is min_step, which keeps the
+    game going as long as possible in case the opponent makes a mistake.
+
+    Preconditions:
+    - 0 < min_step <= max_step <= goal
+
+    >>> move_table(21, 1, 3)[:6]
+    (1, 1, 3, 2, 1, 1)
+    >>> move_table(21, 1, 3)[18:]
+    (3, 2, 1)
+    """
+    next_losing = _next_losing(goal, min_step, max_step)
+    moves = []
+    for count in range(goal):
+        if count + max_step >= goal:
+            moves.append(max(goal - count, min_step))
+        elif next_losing[count + min_step] <= count + max_step:
+            moves.append(next_losing[count + min_step] - count)
+        else:
+            moves.append(min_step)
+    return tuple(moves)
+
+
+def _next_losing(goal: int, min_step: int, max_step: int) -> list[int]:
+    """Return a list whose item at index <count> is the smallest losing
+    position that is at least <count>, or a number above goal + max_step if
+    there is none, for every count up to goal + max_step.
+    """
+    none = goal + max_step + 1
+    next_losing = [none] * (goal + max_step + 1)
+    for count in range(goal - 1, -1, -1):
+        # From count, the reachable positions below the goal are
+        # count + min_step to count + max_step, so the one that matters is
+        # the nearest losing position to count + min_step.
+        if count + max_step < goal and next_losing[count + min_step] > count + max_step:
+            next_losing[count] = count
+        else:
+            next_losing[count] = next_losing[count + 1]
+    return next_losing
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,163 @@
+"""CSC148 Lab 3: Number game tournaments
+
+=== CSC148 Winter 2025 ===
+Department of Computer Science,
+University of Toronto
+
+=== Module Description ===
+This module compares Player subclasses by playing many headless games between
+every pair of them, for several (goal, min_step, max_step) configurations.
+
+The games are split into batches that run in a pool of worker processes.
+Every batch seeds the random module from the tournament seed and the batch's
+position, so the results do not depend on the number of workers or on which
+worker runs which batch.
+
+Player subclasses must be defined at module level (so they can be sent to the
+worker processes), take just a name to construct, and always make legal moves.
+"""
+from __future__ import annotations
+import csv
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable
+
+from lab3 import Player
+from simulation import simulate
+
+# A (goal, min_step, max_step) game configuration.
+Config = tuple[int, int, int]
+
+
+class TournamentRow:
+    """The combined results of every game between two players for one game
+    configuration.
+
+    Attributes:
+    - config: the (goal, min_step, max_step) the games were played with.
+    - players: the names of the two Player subclasses.
+    - games: the number of games played.
+    - wins: wins[i] is the number of games won by players[i].
+
+    Representation Invariants:
+    - self.games == self.wins[0] + self.wins[1]
+    """
+    config: Config
+    players: tuple[str, str]
+    games: int
+    wins: list[int]
+
+    def __init__(self, config: Config, players: tuple[str, str]) -> None:
+        """Initialize a row with no games played yet.
+        """
+        self.config = config
+        self.players = players
+        self.games = 0
+        self.wins = [0, 0]
+
+    def __repr__(self) -> str:
+        """Return a one-line summary of this row.
+        """
+        return (f'{self.config}: {self.players[0]} {self.wins[0]} - '
+                f'{self.wins[1]} {self.players[1]}')
+
+
+def run_tournament(player_types: Iterable[type[Player]], configs: Iterable[Config],
+                   games: int, seed: int = 0, batch_size: int = 10_000,
+                   workers: int | None = None) -> list[TournamentRow]:
+    """Play <games> games between every pair of different classes in
+    <player_types> for every configuration in <configs>, and return one row
+    per (configuration, pair).
+
+    Players take turns moving first. The games are played in batches of at
+    most <batch_size> games on <workers> processes (os.cpu_count() if None,
+    or in this process if 0). Playing in this process leaves the random
+    module's state as it was.
+
+    Preconditions:
+    - games >= 0
+    - batch_size > 0
+    - the classes in player_types have different names
+
+    >>> from lab3 import RandomPlayer
+    >>> class Cautious(RandomPlayer):
+    ...     pass
+    >>> rows = run_tournament([RandomPlayer, Cautious], [(1, 1, 1)], 10, workers=0)
+    >>> rows
+    [(1, 1, 1): RandomPlayer 5 - 5 Cautious]
+    >>> random.seed(148)
+    >>> expected = random.random()
+    >>> random.seed(148)
+    >>> _ = run_tournament([RandomPlayer, Cautious], [(21, 1, 3)], 10, workers=0)
+    >>> random.random() == expected
+    True
+    """
+    player_types = list(player_types)
+    rows = []
+    tasks = []
+    for config in configs:
+        for i in range(len(player_types)):
+            for j in range(i + 1, len(player_types)):
+                pair = (player_types[i], player_types[j])
+                rows.append(TournamentRow(config, (pair[0].__name__, pair[1].__name__)))
+                for batch, start in enumerate(range(0, games, batch_size)):
+                    # Swap who moves first every batch, so that neither player
+                    # moves first more often when batch_size is odd.
+                    n = min(batch_size, games - start)
+                    tasks.append((len(rows) - 1, pair, config, n, batch % 2 == 1,
+                                  f'{seed}-{len(tasks)}'))
+
+    if workers == 0:
+        # Play everything in this process (useful for debugging). The batches
+        # reseed the random module, so put back the caller's state afterwards.
+        state = random.getstate()
+        try:
+            results = list(map(_play_batch, tasks))
+        finally:
+            random.setstate(state)
+    else:
+        chunksize = max(1, len(tasks) // (4 * (workers or os.cpu_count() or 1)))
+        with ProcessPoolExecutor(workers) as pool:
+            results = list(pool.map(_play_batch, tasks, chunksize=chunksize))
+    for row, wins in results:
+        rows[row].games += wins[0] + wins[1]
+        rows[row].wins[0] += wins[0]
+        rows[row].wins[1] += wins[1]
+    return rows
+
+
+def write_table(rows: Iterable[TournamentRow], path: str) -> None:
+    """Write <rows> to a CSV file at <path>, one line per row.
+    """
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['goal', 'min_step', 'max_step', 'player_a', 'player_b',
+                         'games', 'wins_a', 'wins_b', 'win_rate_a'])
+        for row in rows:
+            writer.writerow([*row.config, *row.players, row.games, *row.wins,
+                             f'{row.wins[0] / row.games:.4f}' if row.games else ''])
+
+
+def _play_batch(task: tuple[int, tuple[type[Player], type[Player]], Config, int, bool, str]
+                ) -> tuple[int, tuple[int, int]]:
+    """Play one batch of games and return its row index and the wins of each
+    player, in the order of the row's players.
+
+    <task> is (row index, player classes, config, number of games, whether the
+    second class moves first in the batch's first game, seed).
+    """
+    row, (first, second), (goal, min_step, max_step), n, swapped, seed = task
+    random.seed(seed)
+    players = (first(first.__name__), second(second.__name__))
+    if swapped:
+        result = simulate((players[1], players[0]), n, goal, min_step, max_step)
+        return row, (result.wins[1], result.wins[0])
+    result = simulate(players, n, goal, min_step, max_step)
+    return row, (result.wins[0], result.wins[1])
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
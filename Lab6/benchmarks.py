@@ -0,0 +1,189 @@
+"""CSC148 Lab 6: Benchmarks
+
+=== CSC148 Winter 2025 ===
+Department of Computer Science,
+University of Toronto
+
+=== Module Description ===
+This module contains benchmarks for the Deck in cards.py and the modules built
+on top of it, and for the LinkedList in prep6.py. Run it directly to print the
+results of every benchmark.
+"""
+import os
+import time
+import tracemalloc
+
+from cards import SUITS, VALUES, Card, Deck, DeckPool
+from deck_batch import DeckBatch
+from estimate import estimate, is_flush
+from prep6 import LinkedList
+
+
+def _full_deck() -> Deck:
+    """Return a new Deck holding all 52 cards, in order.
+    """
+    deck = Deck()
+    for s in SUITS:
+        for v in VALUES:
+            deck.add_card(v, s)
+    return deck
+
+
+def bench_deck_memory(n: int = 10_000) -> None:
+    """Print the memory used by <n> full decks, compared with <n> lists of 52
+    Card objects (how Deck used to store its cards).
+    """
+    tracemalloc.start()
+    decks = [_full_deck() for _ in range(n)]
+    deck_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del decks
+
+    tracemalloc.start()
+    lists = [[Card(v, s) for s in SUITS for v in VALUES] for _ in range(n)]
+    list_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del lists
+
+    print(f'{n} decks: Deck {deck_bytes / n:6.0f} bytes/deck, '
+          f'list[Card] {list_bytes / n:6.0f} bytes/deck')
+
+
+def bench_draw(n: int = 10_000) -> None:
+    """Print how many cards per second are drawn from <n> full decks, and how
+    many full decks per second are built with add_card.
+    """
+    start = time.perf_counter()
+    decks = [_full_deck() for _ in range(n)]
+    built = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for deck in decks:
+        while deck.draw_card() is not None:
+            pass
+    drawn = time.perf_counter() - start
+
+    print(f'build: {n / built / 1e3:6.1f}k decks/s, '
+          f'draw_card: {52 * n / drawn / 1e6:5.2f}M cards/s')
+
+
+def bench_deal(rounds: int = 20_000, n_hands: int = 4, cards_per_hand: int = 5) -> None:
+    """Print how many hands per second are dealt in <rounds> rounds of
+    <n_hands> hands of <cards_per_hand> cards, each from a new shuffled deck.
+
+    Decks from a DeckPool dealt with deal are compared with decks built with
+    add_card and dealt one draw_card at a time. The shuffle takes the same
+    time in both, so it is also timed on its own.
+    """
+    pool = DeckPool(1)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        deck = pool.acquire()
+        deck.shuffle()
+        deck.deal(n_hands, cards_per_hand)
+        pool.release(deck)
+    pooled = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        deck = _full_deck()
+        deck.shuffle()
+        hands = [[] for _ in range(n_hands)]
+        for _ in range(cards_per_hand):
+            for hand in hands:
+                hand.append(deck.draw_card())
+    drawn = time.perf_counter() - start
+
+    deck = pool.acquire()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        deck.shuffle()
+    shuffled = time.perf_counter() - start
+
+    hands = rounds * n_hands
+    print(f'{n_hands} hands of {cards_per_hand}: '
+          f'pool + deal {hands / pooled / 1e3:6.1f}k hands/s, '
+          f'add_card + draw_card {hands / drawn / 1e3:6.1f}k hands/s '
+          f'(shuffle alone {rounds / shuffled / 1e3:.1f}k decks/s)')
+
+
+def bench_batch_shuffle(sizes: tuple[int, ...] = (100, 1_000, 10_000)) -> None:
+    """Print how many decks per second are shuffled by a DeckBatch of each
+    size in <sizes>, compared with calling Deck.shuffle on that many decks.
+    """
+    for n in sizes:
+        batch = DeckBatch(n, seed=148)
+        start = time.perf_counter()
+        batch.shuffle()
+        batched = time.perf_counter() - start
+
+        pool = DeckPool(n)
+        decks = [pool.acquire() for _ in range(n)]
+        start = time.perf_counter()
+        for deck in decks:
+            deck.shuffle()
+        looped = time.perf_counter() - start
+
+        print(f'{n:6} decks: DeckBatch.shuffle {n / batched / 1e3:7.1f}k decks/s, '
+              f'Deck.shuffle {n / looped / 1e3:5.1f}k decks/s '
+              f'({looped / batched:.1f}x)')
+
+
+def bench_estimate(trials: int = 200_000) -> None:
+    """Print how many hands per second are checked for a flush when
+    estimating its probability from <trials> hands, with estimate on one
+    process and on one process per CPU, compared with dealing each hand from
+    a new deck with draw_card in this process.
+    """
+    start = time.perf_counter()
+    for _ in range(trials):
+        deck = _full_deck()
+        deck.shuffle()
+        is_flush([deck.draw_card() for _ in range(5)])
+    serial = time.perf_counter() - start
+    print(f'draw_card: {trials / serial / 1e3:6.1f}k hands/s')
+
+    cpus = os.cpu_count() or 1
+    # On a machine with one CPU the second case is the same as the first.
+    for workers, hands_per_deck in dict.fromkeys([(1, 1), (cpus, 1), (cpus, 10)]):
+        start = time.perf_counter()
+        estimate(is_flush, trials, hands_per_deck=hands_per_deck, seed=148,
+                 max_workers=workers)
+        elapsed = time.perf_counter() - start
+        print(f'estimate, {workers} worker(s), {hands_per_deck:2} hands/deck: '
+              f'{trials / elapsed / 1e3:6.1f}k hands/s')
+
+
+def bench_linked_list_build(sizes: tuple[int, ...] = (1_000, 2_000, 4_000, 8_000)) -> None:
+    """Print the time per item to build a LinkedList of each size in <sizes>
+    one item at a time at its end.
+
+    insert(len(lst), x) and append(x) use the last node directly. Walking to
+    the end, which is what insert(len(lst), x) did before LinkedList kept its
+    last node, is measured with insert(len(lst) - 1, x), which walks just as
+    far. Its time per item grows with the size, so building is quadratic.
+    """
+    cases = [('append', lambda lst, i: lst.append(i)),
+             ('insert at end', lambda lst, i: lst.insert(len(lst), i)),
+             ('walk to end', lambda lst, i: lst.insert(max(len(lst) - 1, 0), i))]
+    for n in sizes:
+        results = []
+        for name, add in cases:
+            lst = LinkedList()
+            start = time.perf_counter()
+            for i in range(n):
+                add(lst, i)
+            results.append(f'{name} {(time.perf_counter() - start) / n * 1e6:7.2f}')
+        start = time.perf_counter()
+        LinkedList().extend(range(n))
+        results.append(f'extend {(time.perf_counter() - start) / n * 1e6:5.2f}')
+        print(f'{n:5} items, us/item: ' + ', '.join(results))
+
+
+if __name__ == '__main__':
+    bench_deck_memory()
+    bench_draw()
+    bench_deal()
+    bench_batch_shuffle()
+    bench_estimate()
+    bench_linked_list_build()
@@ -1,5 +1,11 @@
 import random
 
+# The suits a card can have. Together with the values 1 to 13, each card is
+# stored in a Deck as the small int SUITS.index(suit) * 13 + value - 1.
+SUITS = ('Clubs', 'Diamonds', 'Hearts', 'Spades')
+VALUES = range(1, 14)
+
+
 class Card:
     """
     The individual cards in the deck
@@ -23,32 +29,52 @@ class Card:
 
 class Deck:
     """
-    Attributes:
-    - top:
-        A dictionary with the top card on it
+    A deck of cards. Each card is stored as a single byte (see SUITS), and
+    a Card is only made when a card is drawn.
+
+    Private Attributes:
+    - _cards:
+        The encoded cards, with the top of the deck at the end
     """
-    _cards: list
+    _cards: bytearray
 
     def __init__(self) -> None:
         """
         Initialize a new empty deck
         """
-        self._cards = []
+        self._cards = bytearray()
+
+    def __len__(self) -> int:
+        """
+        Return the number of cards in the deck
+
+        >>> deck = Deck()
+        >>> deck.add_card(1, "Spades")
+        >>> len(deck)
+        1
+        """
+        return len(self._cards)
 
     def add_card(self, v: int, s: str) -> None:
         """
-        Add a card to the deck, and update the top of the deck
+        Add a card to the top of the deck
+
+        Raise ValueError if v is not in VALUES or s is not in SUITS.
 
         >>> deck = Deck()
         >>> deck.add_card(1, "Spades")
         >>> deck.print_cards()
         1 Spades
+        >>> deck.add_card(14, "Spades")
+        Traceback (most recent call last):
+        ...
+        ValueError: not a card: 14 Spades
         """
-        self._cards.append(Card(v, s))
+        self._cards.append(_encode(v, s))
 
-    def draw_card(self) -> dict | None:
+    def draw_card(self) -> Card | None:
         """
-        Return the top card
+        Remove and return the top card, or return None if the deck is empty
 
         >>> deck = Deck()
         >>> deck.add_card(1, "Spades")
@@ -58,11 +84,57 @@ class Deck:
         """
         if len(self._cards) == 0:
             return None
-        return self._cards.pop()
+        return Card(*_CARDS[self._cards.pop()])
+
+    def deal(self, n_hands: int, cards_per_hand: int) -> list[list[Card]]:
+        """
+        Deal cards_per_hand cards to each of n_hands hands from the top of the
+        deck, one card to each hand in turn, and return the hands
 
-    def shuffle(self) -> None:
+        This deals the same hands as drawing the cards one at a time, but
+        takes them all off the deck at once.
+
+        Raise ValueError if there are not enough cards in the deck.
+
+        >>> deck = Deck()
+        >>> deck.reset()
+        >>> deck.deal(2, 3)
+        [[Suit:Spades Value:13, Suit:Spades Value:11, Suit:Spades Value:9], \
+[Suit:Spades Value:12, Suit:Spades Value:10, Suit:Spades Value:8]]
+        >>> len(deck)
+        46
+        >>> deck.deal(10, 5)
+        Traceback (most recent call last):
+        ...
+        ValueError: cannot deal 50 cards from a deck of 46
         """
-        Shuffle the deck
+        count = n_hands * cards_per_hand
+        start = len(self._cards) - count
+        if start < 0:
+            raise ValueError(f'cannot deal {count} cards from a deck of {len(self._cards)}')
+        dealt = self._cards[start:][::-1]
+        del self._cards[start:]
+        return [[Card(*_CARDS[code]) for code in dealt[i::n_hands]] for i in range(n_hands)]
+
+    def reset(self) -> None:
+        """
+        Put all 52 cards in the deck, in order: Clubs 1 to 13, then Diamonds,
+        Hearts and Spades, with the Spades 13 on top
+
+        >>> deck = Deck()
+        >>> deck.add_card(1, "Spades")
+        >>> deck.reset()
+        >>> len(deck)
+        52
+        >>> deck.draw_card()
+        Suit:Spades Value:13
+        """
+        self._cards[:] = _FULL_DECK
+
+    def shuffle(self, rng: random.Random | None = None) -> None:
+        """
+        Shuffle the deck using rng, or the random module's shared generator
+        if rng is None
 
         >>> deck = Deck()
         >>> deck.add_card(1, "Spades")
@@ -74,9 +146,9 @@ class Deck:
         2 Clubs
         3 Diamonds
         4 Hearts
-        >>> deck.shuffle()
+        >>> deck.shuffle(random.Random(148))
         """
-        random.shuffle(self._cards)
+        (random if rng is None else rng).shuffle(self._cards)
 
     def print_cards(self) -> None:
         """
@@ -93,8 +165,85 @@ class Deck:
         3 Diamonds
         4 Hearts
         """
-        for c in self._cards:
-            print(c.value, c.suit)
+        for code in self._cards:
+            print(*_CARDS[code])
+
+
+def _encode(v: int, s: str) -> int:
+    """
+    Return the byte that stands for the card with value v and suit s
+
+    Raise ValueError if there is no such card.
+    """
+    try:
+        return _CODES[(v, s)]
+    except KeyError:
+        raise ValueError(f'not a card: {v} {s}') from None
+
+
+# _CARDS[code] is the (value, suit) of the card stored as code, and _CODES
+# maps each (value, suit) back to its code.
+_CARDS = [(v, s) for s in SUITS for v in VALUES]
+_CODES = {card: code for code, card in enumerate(_CARDS)}
+_FULL_DECK = bytes(range(len(_CARDS)))
+
+
+class DeckPool:
+    """
+    A pool of full decks that can be used again and again, so that a
+    simulation that needs a new deck many times does not build every one
+    from scratch
+
+    Private Attributes:
+    - _free:
+        The decks that are ready to be handed out, all full and in order
+
+    >>> pool = DeckPool(1)
+    >>> deck = pool.acquire()
+    >>> deck.shuffle()
+    >>> hands = deck.deal(4, 5)
+    >>> pool.release(deck)
+    >>> len(pool.acquire())
+    52
+    """
+    _free: list[Deck]
+
+    def __init__(self, size: int = 0) -> None:
+        """
+        Initialize a pool with size decks ready to be handed out
+        """
+        self._free = []
+        for _ in range(size):
+            deck = Deck()
+            deck.reset()
+            self._free.append(deck)
+
+    def __len__(self) -> int:
+        """
+        Return the number of decks ready to be handed out
+        """
+        return len(self._free)
+
+    def acquire(self) -> Deck:
+        """
+        Return a full deck, in order, that nobody else is using
+
+        A new deck is made if the pool has none ready.
+        """
+        if self._free:
+            return self._free.pop()
+        deck = Deck()
+        deck.reset()
+        return deck
+
+    def release(self, deck: Deck) -> None:
+        """
+        Give deck back to the pool, which makes it full and in order again
+
+        The caller must not use deck again until it is handed out again.
+        """
+        deck.reset()
+        self._free.append(deck)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,164 @@
+"""CSC148 Lab 6: Batches of decks
+
+=== CSC148 Winter 2025 ===
+Department of Computer Science,
+University of Toronto
+
+=== Module Description ===
+This module holds many decks of cards in one NumPy array, so that all of them
+can be shuffled and dealt at once instead of one Deck at a time.
+
+Cards are stored as in Deck: the card with value v and suit s is the small
+int SUITS.index(s) * 13 + v - 1, and the top of each deck is its last card.
+
+Every shuffle gives each card a random 64-bit key and sorts each deck by its
+keys. The keys come from SplitMix64 hashes of the batch's seed, then the
+deck's index, then how many times the batch has been shuffled, and then the
+card's position, so each deck has its own stream of shuffles: the same seed
+always gives the same decks, however many decks are in the batch.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+from cards import SUITS, VALUES, Card, Deck
+
+DECK_SIZE = len(SUITS) * len(VALUES)
+
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+
+
+class DeckBatch:
+    """A batch of full decks of cards.
+
+    Attributes:
+    - cards: the cards of every deck, one deck per row, with the top of each
+      deck at the end of its row.
+
+    Private Attributes:
+    - _seed: the seed of every deck's stream of shuffles.
+    - _rounds: the number of times the batch has been shuffled.
+
+    Representation Invariants:
+    - self.cards.shape[1] == DECK_SIZE
+    - every row of self.cards holds each of 0 to DECK_SIZE - 1 once
+    - self._rounds >= 0
+
+    >>> batch = DeckBatch(3, seed=148)
+    >>> batch.shuffle()
+    >>> batch.cards.shape
+    (3, 52)
+    >>> sorted(batch.cards[1].tolist()) == list(range(52))
+    True
+    >>> again = DeckBatch(5, seed=148)
+    >>> again.shuffle()
+    >>> bool((again.cards[:3] == batch.cards).all())
+    True
+    """
+    cards: np.ndarray
+    _seed: int
+    _rounds: int
+
+    def __init__(self, n: int, seed: int = 0) -> None:
+        """Initialize a batch of <n> full decks, each in the order left by
+        Deck.reset, whose shuffles are decided by <seed>.
+
+        Preconditions:
+        - n >= 0
+        - 0 <= seed < 2 ** 64
+        """
+        self.cards = np.tile(np.arange(DECK_SIZE, dtype=np.uint8), (n, 1))
+        self._seed = seed
+        self._rounds = 0
+
+    def __len__(self) -> int:
+        """Return the number of decks in this batch.
+        """
+        return len(self.cards)
+
+    def shuffle(self) -> None:
+        """Shuffle every deck in this batch.
+
+        >>> batch = DeckBatch(1, seed=1)
+        >>> first = batch.cards.copy()
+        >>> batch.shuffle()
+        >>> bool((batch.cards == first).all())
+        False
+
+        Decks with different seeds or indexes have unrelated streams, e.g.
+        deck 0 of seed 1 is not deck 1 of seed 0:
+
+        >>> zero, one = DeckBatch(2, seed=0), DeckBatch(1, seed=1)
+        >>> zero.shuffle()
+        >>> one.shuffle()
+        >>> bool((zero.cards[1] == one.cards[0]).all())
+        False
+        """
+        # Hash the seed before mixing in the index, so that nearby seeds do
+        # not share decks at shifted indexes (as seed + index would).
+        seed = _splitmix64(np.array([self._seed], dtype=np.uint64))
+        decks = np.arange(len(self.cards), dtype=np.uint64)
+        stream = _splitmix64(_splitmix64(seed ^ decks) ^ np.uint64(self._rounds))
+        positions = np.arange(DECK_SIZE, dtype=np.uint64)
+        keys = _splitmix64(stream[:, None] + positions * _GOLDEN)
+        order = np.argsort(keys, axis=1)
+        self.cards = np.take_along_axis(self.cards, order, axis=1)
+        self._rounds += 1
+
+    def deal(self, n_hands: int, cards_per_hand: int) -> np.ndarray:
+        """Deal <cards_per_hand> cards to each of <n_hands> hands from the
+        top of every deck, one card to each hand in turn, as Deck.deal does.
+
+        Return an array whose item [d, h] is hand h from deck d. The decks
+        themselves are not changed.
+
+        Raise ValueError if there are not enough cards in a deck.
+
+        >>> batch = DeckBatch(2)
+        >>> batch.deal(2, 3)[0].tolist()
+        [[51, 49, 47], [50, 48, 46]]
+        >>> [decode(code) for code in batch.deal(2, 3)[1, 0]]
+        [Suit:Spades Value:13, Suit:Spades Value:11, Suit:Spades Value:9]
+        """
+        count = n_hands * cards_per_hand
+        if count > DECK_SIZE:
+            raise ValueError(f'cannot deal {count} cards from a deck of {DECK_SIZE}')
+        dealt = self.cards[:, DECK_SIZE - count:][:, ::-1]
+        return dealt.reshape(len(self.cards), cards_per_hand, n_hands).transpose(0, 2, 1)
+
+    def deck(self, i: int) -> Deck:
+        """Return a new Deck holding the cards of deck <i> in this batch.
+
+        >>> DeckBatch(1).deck(0).draw_card()
+        Suit:Spades Value:13
+        """
+        deck = Deck()
+        for code in self.cards[i].tolist():
+            card = decode(code)
+            deck.add_card(card.value, card.suit)
+        return deck
+
+
+def decode(code: int) -> Card:
+    """Return the card stored as <code>.
+
+    >>> decode(0)
+    Suit:Clubs Value:1
+    """
+    suit, value = divmod(int(code), len(VALUES))
+    return Card(VALUES[value], SUITS[suit])
+
+
+def _splitmix64(x: np.ndarray) -> np.ndarray:
+    """Return the SplitMix64 hash of every item of <x>.
+    """
+    z = x + _GOLDEN
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,178 @@
+"""CSC148 Lab 6: Estimating probabilities of hands
+
+=== CSC148 Winter 2025 ===
+Department of Computer Science,
+University of Toronto
+
+=== Module Description ===
+This module estimates the probability that a hand dealt from a shuffled deck
+has some property, such as being a flush, by dealing many hands.
+
+The trials are split into chunks that are run by a pool of processes, so the
+estimate takes less time on a machine with more cores. Each chunk has its own
+random.Random, seeded from the estimate's seed, and the chunks do not depend
+on the number of processes, so the same seed always gives the same estimate.
+"""
+from __future__ import annotations
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+from typing import Callable
+
+from cards import Card, Deck
+
+
+class ProbabilityEstimate:
+    """An estimate of a probability, from a number of trials.
+
+    Attributes:
+    - trials: the number of trials.
+    - hits: the number of those trials in which the event happened.
+    - confidence: the confidence level of the interval, e.g. 0.95.
+    - low: the lower end of the confidence interval for the probability.
+    - high: the upper end of the confidence interval for the probability.
+
+    Representation Invariants:
+    - 0 <= self.hits <= self.trials
+    - 0 <= self.low <= self.high <= 1
+    """
+    trials: int
+    hits: int
+    confidence: float
+    low: float
+    high: float
+
+    def __init__(self, trials: int, hits: int, confidence: float) -> None:
+        """Initialize the estimate for an event that happened in <hits> of
+        <trials> trials, with a Wilson score interval at <confidence>.
+        """
+        self.trials = trials
+        self.hits = hits
+        self.confidence = confidence
+        self.low, self.high = wilson_interval(hits, trials, confidence)
+
+    def __repr__(self) -> str:
+        """Return a one-line summary of this estimate.
+        """
+        return (f'{self.probability():.4f} ({self.confidence:.0%} CI '
+                f'{self.low:.4f}-{self.high:.4f}, {self.trials} trials)')
+
+    def probability(self) -> float:
+        """Return the fraction of trials in which the event happened.
+        """
+        return self.hits / self.trials if self.trials else 0.0
+
+
+# Lab 3's monte_carlo.py has the same function for win rates. Each lab is run
+# from its own directory and imports nothing from the others, so it is copied.
+def wilson_interval(hits: int, trials: int, confidence: float) -> tuple[float, float]:
+    """Return the Wilson score interval at <confidence> for a probability,
+    given an event that happened in <hits> of <trials> trials.
+
+    Unlike hits / trials plus or minus a margin, the interval stays inside
+    [0, 1] and is not empty when the event never or always happened.
+
+    Preconditions:
+    - 0 <= hits <= trials
+    - 0 < confidence < 1
+
+    >>> low, high = wilson_interval(0, 1000, 0.95)
+    >>> round(low, 4), round(high, 4)
+    (0.0, 0.0038)
+    >>> wilson_interval(0, 0, 0.95)
+    (0.0, 1.0)
+    """
+    if trials == 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    p = hits / trials
+    centre = p + z * z / (2 * trials)
+    spread = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials))
+    scale = 1 + z * z / trials
+    return max(0.0, (centre - spread) / scale), min(1.0, (centre + spread) / scale)
+
+
+def is_flush(hand: list[Card]) -> bool:
+    """Return whether every card in <hand> has the same suit.
+
+    >>> is_flush([Card(2, 'Hearts'), Card(9, 'Hearts')])
+    True
+    """
+    return len({card.suit for card in hand}) == 1
+
+
+def has_pair(hand: list[Card]) -> bool:
+    """Return whether two cards in <hand> have the same value.
+
+    >>> has_pair([Card(2, 'Hearts'), Card(9, 'Spades'), Card(2, 'Clubs')])
+    True
+    """
+    return len({card.value for card in hand}) < len(hand)
+
+
+def estimate(predicate: Callable[[list[Card]], bool], trials: int, hand_size: int = 5,
+             hands_per_deck: int = 1, seed: int | None = None, confidence: float = 0.95,
+             max_workers: int | None = None, chunk_size: int = 20_000
+             ) -> ProbabilityEstimate:
+    """Deal <trials> hands of <hand_size> cards and return an estimate of
+    the probability that <predicate> is true of a hand.
+
+    Each deck is shuffled and then <hands_per_deck> hands are dealt from it
+    at once. Dealing more than one hand per deck is faster, but the hands
+    from one deck are not independent, so the confidence interval is then
+    only approximate.
+
+    The trials are run in chunks of at most <chunk_size> by <max_workers>
+    processes (one per CPU if None), or in this process if <max_workers> is
+    1. <predicate> must be picklable, e.g. a function defined at the top
+    level of a module.
+
+    Preconditions:
+    - trials >= 0
+    - hand_size > 0 and hands_per_deck > 0
+    - hand_size * hands_per_deck <= 52
+    - 0 < confidence < 1
+    - max_workers is None or max_workers > 0
+    - chunk_size > 0
+
+    >>> estimate(is_flush, 20_000, seed=148, max_workers=1, chunk_size=5_000)
+    0.0021 (95% CI 0.0016-0.0028, 20000 trials)
+    >>> estimate(is_flush, 20_000, seed=148, max_workers=2, chunk_size=5_000)
+    0.0021 (95% CI 0.0016-0.0028, 20000 trials)
+    """
+    seeds = random.Random(seed)
+    chunks = []
+    for start in range(0, trials, chunk_size):
+        chunks.append((predicate, min(chunk_size, trials - start), hand_size,
+                       hands_per_deck, seeds.getrandbits(64)))
+    if max_workers == 1:
+        hits = sum(_count_hits(*chunk) for chunk in chunks)
+    else:
+        with ProcessPoolExecutor(max_workers) as executor:
+            hits = sum(executor.map(_count_hits, *zip(*chunks)))
+    return ProbabilityEstimate(trials, hits, confidence)
+
+
+def _count_hits(predicate: Callable[[list[Card]], bool], trials: int, hand_size: int,
+                hands_per_deck: int, seed: int) -> int:
+    """Deal <trials> hands of <hand_size> cards, <hands_per_deck> from each
+    shuffled deck, with a random.Random seeded with <seed>, and return how
+    many of them <predicate> is true of.
+    """
+    rng = random.Random(seed)
+    deck = Deck()
+    hits = 0
+    for start in range(0, trials, hands_per_deck):
+        deck.reset()
+        deck.shuffle(rng)
+        for hand in deck.deal(min(hands_per_deck, trials - start), hand_size):
+            if predicate(hand):
+                hits += 1
+    return hits
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
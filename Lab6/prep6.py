@@ -11,7 +11,7 @@ LinkedList and _Node.
 All of the code from lecture is here, as well as some exercises to work on.
 """
 from __future__ import annotations
-from typing import Any
+from typing import Any, Iterable
 
 
 class _Node:
@@ -42,6 +42,14 @@ class LinkedList:
     Private Attributes:
     - _first:
         The first node in the linked list, or None if the list is empty.
+    - _last:
+        The last node in the linked list, or None if the list is empty.
+    - _length:
+        The number of items in the linked list.
+
+    Representation Invariants:
+    - (self._first is None) == (self._last is None) == (self._length == 0)
+    - self._last is None or self._last.next is None
     """
 
     ###########################################################################
@@ -57,21 +65,17 @@ class LinkedList:
     #    the items 1 -> 2 -> 3
     ###########################################################################
     _first: _Node | None
+    _last: _Node | None
     _length: int
 
     def __init__(self, items: list | None = None) -> None:
         """Initialize a new empty linked list containing the given items.
         """
-        if items is None or len(items) == 0:
-            self._first = None
-            self._length = 0
-        else:
-            self._first = _Node(items[0])
-            curr = self._first
-            for item in items[1:]:
-                curr.next = _Node(item)
-                curr = curr.next
-            self._length = len(items)
+        self._first = None
+        self._last = None
+        self._length = 0
+        if items is not None:
+            self.extend(items)
 
     def is_empty(self) -> bool:
         """Return whether this linked list is empty.
@@ -99,6 +103,38 @@ class LinkedList:
             curr = curr.next
         return '[' + ' -> '.join(items) + ']'
 
+    def append(self, item: Any) -> None:
+        """Add <item> to the end of this list.
+
+        This takes O(1) time, since the last node is kept in _last.
+
+        >>> lst = LinkedList([])
+        >>> lst.append(1)
+        >>> lst.append(2)
+        >>> str(lst), len(lst)
+        ('[1 -> 2]', 2)
+        """
+        new_node = _Node(item)
+        if self._last is None:
+            self._first = new_node
+        else:
+            self._last.next = new_node
+        self._last = new_node
+        self._length += 1
+
+    def extend(self, items: Iterable) -> None:
+        """Add every item in <items> to the end of this list, in order.
+
+        This takes O(k) time for k items.
+
+        >>> lst = LinkedList([1])
+        >>> lst.extend(range(2, 5))
+        >>> str(lst), len(lst)
+        ('[1 -> 2 -> 3 -> 4]', 4)
+        """
+        for item in items:
+            self.append(item)
+
     ###########################################################################
     # [Part 2] Augmenting our LinkedList
     #
@@ -125,7 +161,13 @@ class LinkedList:
         >>> lst.insert(0, 10)
         >>> str(lst)
         '[10 -> 1 -> 2 -> 300 -> 10 -> 200 -> -1]'
+        >>> len(lst)
+        7
         """
+        if index == self._length:
+            # Adding to the end (or to an empty list) doesn't need to walk.
+            self.append(item)
+            return
 
         # Create new node containing the item
         new_node = _Node(item)
@@ -146,7 +188,7 @@ class LinkedList:
             else:
                 # Update links to insert new node
                 curr.next, new_node.next = new_node, curr.next
-            self._length += 1
+        self._length += 1
 
     def pop(self, index: int) -> Any:
         """Remove and return the item at position <index>.
@@ -163,12 +205,25 @@ class LinkedList:
         IndexError
         >>> lst.pop(0)
         1
+        >>> lst.pop(0)
+        10
+        >>> lst.append(3)
+        >>> str(lst)
+        '[3]'
+        >>> lst.pop(0)
+        3
+        >>> lst.pop(0)
+        Traceback (most recent call last):
+        IndexError
         """
         if index == 0:
-            if self._first is not None:
-                item, self._first = self._first.item, self._first.next
-                self._length -= 1
-                return item
+            if self._first is None:
+                raise IndexError
+            item, self._first = self._first.item, self._first.next
+            if self._first is None:
+                self._last = None
+            self._length -= 1
+            return item
         else:            # Iterate to (index-1)-th node.
             curr = self._first
             curr_index = 0
@@ -181,6 +236,8 @@ class LinkedList:
             else:
                 # Update link to skip over i-th node
                 item, curr.next = curr.next.item, curr.next.next
+                if curr.next is None:
+                    self._last = curr
                 self._length -= 1
                 return item
 
@@ -245,29 +302,21 @@ class LinkedList:
         >>> lst[2] = 300
         >>> str(lst)
         '[100 -> 200 -> 300]'
+        >>> lst.append(400)
+        >>> str(lst)
+        '[100 -> 200 -> 300 -> 400]'
         """
         #Handle edge case of index > linked list
-        if index >= self._length:
+        if index >= self._length or index < 0:
             raise IndexError
-        new_node = _Node(item)
-        if index == 0:
-            #Handle edge case of changing the first element
-            next_node = self._first.next
-            new_node.next = next_node
-            self._first = new_node
-        else:
-            #Parse the linked list and keep track of both current and previous element
-            curr = self._first.next
-            curr_index = 1
-            previous_curr = self._first
-            while curr is not None:
-                if curr_index == index:
-                    #Link the node to the linked list
-                    previous_curr.next = new_node
-                    new_node.next = curr.next
-                curr = curr.next
-                previous_curr = previous_curr.next
-                curr_index += 1
+        #Store the item in the existing node, so no links (or _last) change
+        if index == self._length - 1:
+            self._last.item = item
+            return
+        curr = self._first
+        for _ in range(index):
+            curr = curr.next
+        curr.item = item
 
 
 if __name__ == '__main__':
@@ -7,7 +7,20 @@ University of Toronto
 === Module Description ===
 This module contains a few nested list functions for you to practice recursion.
 """
-from python_ta.contracts import check_contracts
+import os
+from typing import Any
+
+
+def _no_contracts(obj: Any) -> Any:
+    """Return <obj> unchanged, without adding any contract checks."""
+    return obj
+
+
+# Contracts are not checked, and python_ta is not imported, if the
+# CHECK_CONTRACTS environment variable is 0.
+check_contracts = _no_contracts
+if os.environ.get('CHECK_CONTRACTS', '1') != '0':
+    from python_ta.contracts import check_contracts
 
 
 @check_contracts
@@ -127,4 +140,4 @@ if __name__ == '__main__':
     doctest.testmod()
 
     import python_ta
-    python_ta.check_all(config={'max-line-length': 100})
+    python_ta.check_all(config={'extra-imports': ['os'], 'max-line-length': 100})
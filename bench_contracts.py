@@ -0,0 +1,58 @@
+"""CSC148 Labs: Contract-checking benchmark
+
+=== CSC148 Winter 2025 ===
+Department of Computer Science,
+University of Toronto
+
+=== Module Description ===
+This script reports the per-call cost of some hot @check_contracts functions
+and methods, with contract checking turned on and off. Run it from anywhere:
+each case is timed with timeit in a fresh process from its own lab directory.
+"""
+import os
+import subprocess
+import sys
+
+# (lab directory, name, setup, statement) for each case to measure.
+CASES = [
+    ('Lab2', 'Tweet.like',
+     'from tweet import Tweet; from datetime import date; '
+     't = Tweet("Rukhsana", date(2017, 9, 16), "Hey!")',
+     't.like(1)'),
+    ('Lab2', 'User.tweet',
+     'from tweet import User; u = User("Rukhsana", "")',
+     'u.tweet("Hey!"); u.tweets.clear()'),
+    ('Lab7', 'add_n',
+     'from nested import add_n; obj = [[i, [i, i]] for i in range(33)] + [0]',
+     'add_n(obj, 1)'),
+]
+
+
+def time_per_call(lab: str, setup: str, stmt: str, check_contracts: bool) -> float:
+    """Return the number of seconds one run of <stmt> takes after <setup>,
+    measured with timeit in a fresh process started in <lab>.
+    """
+    env = dict(os.environ, CHECK_CONTRACTS='1' if check_contracts else '0')
+    cwd = os.path.join(os.path.dirname(os.path.abspath(__file__)), lab)
+    output = subprocess.run(
+        [sys.executable, '-c',
+         'import timeit\n'
+         f'timer = timeit.Timer({stmt!r}, {setup!r})\n'
+         'number, _ = timer.autorange()\n'
+         'print(min(timer.repeat(5, number)) / number)'],
+        env=env, cwd=cwd, capture_output=True, text=True, check=True).stdout
+    return float(output)
+
+
+def main() -> None:
+    """Print the per-call cost of every case in CASES.
+    """
+    for lab, name, setup, stmt in CASES:
+        checked = time_per_call(lab, setup, stmt, True)
+        unchecked = time_per_call(lab, setup, stmt, False)
+        print(f'{lab} {name}: {checked * 1e6:10.2f} us checked, '
+              f'{unchecked * 1e6:8.2f} us unchecked ({checked / unchecked:.0f}x)')
+
+
+if __name__ == '__main__':
+    main()
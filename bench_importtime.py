@@ -0,0 +1,56 @@
+"""CSC148 Labs: Import-time benchmark
+
+=== CSC148 Winter 2025 ===
+Department of Computer Science,
+University of Toronto
+
+=== Module Description ===
+This script reports how long it takes to import each lab module that uses
+@check_contracts, with contract checking turned on and off, as measured by
+python -X importtime. Run it from anywhere: each module is imported in a
+fresh process from its own lab directory.
+"""
+import os
+import subprocess
+import sys
+
+# (lab directory, module name) pairs to measure.
+MODULES = [
+    ('Lab2', 'tweet'),
+    ('Lab3', 'lab3'),
+    ('Lab7', 'nested'),
+]
+
+
+def import_time(lab: str, module: str, check_contracts: bool,
+                repeats: int = 5) -> float:
+    """Return the smallest cumulative import time of <module>, in milliseconds,
+    over <repeats> fresh processes.
+    """
+    env = dict(os.environ, CHECK_CONTRACTS='1' if check_contracts else '0')
+    cwd = os.path.join(os.path.dirname(os.path.abspath(__file__)), lab)
+    best = float('inf')
+    for _ in range(repeats):
+        stderr = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                                env=env, cwd=cwd, capture_output=True, text=True,
+                                check=True).stderr
+        for line in stderr.splitlines():
+            # Lines look like "import time:  self [us] | cumulative | name"
+            fields = line.split('|')
+            if len(fields) == 3 and fields[2].strip() == module:
+                best = min(best, int(fields[1]) / 1000)
+    return best
+
+
+def main() -> None:
+    """Print the import time of every module in MODULES.
+    """
+    for lab, module in MODULES:
+        checked = import_time(lab, module, True)
+        unchecked = import_time(lab, module, False)
+        print(f'{lab}/{module}.py: {checked:8.1f} ms with contracts, '
+              f'{unchecked:6.1f} ms without')
+
+
+if __name__ == '__main__':
+    main()